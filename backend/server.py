@@ -1,27 +1,218 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, File, UploadFile
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, status, File, UploadFile, Response, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, IndexModel, ReturnDocument, CursorType, ASCENDING, DESCENDING, TEXT, monitoring
+from pymongo.errors import OperationFailure, BulkWriteError, DuplicateKeyError, CollectionInvalid
 import os
+import asyncio
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter, ValidationError
 from typing import List, Optional, Dict, Any
 import uuid
+import time
+import threading
+import multiprocessing
+import cProfile
+import pstats
+from contextvars import ContextVar
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+import numpy as np
 from datetime import datetime, timedelta
 import hashlib
+import hmac
+import base64
+import json
+import csv
+import codecs
+import io
 import jwt
 from passlib.context import CryptContext
+from PIL import Image, ImageOps, UnidentifiedImageError
 import re
 from enum import Enum
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# ============= DATABASE INSTRUMENTATION =============
+
+class LatencyHistogram:
+    # Cumulative-bucket histogram in the Prometheus layout (upper bounds in seconds)
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(self.BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.bucket_counts[bisect_left(self.BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def cumulative(self) -> List[tuple]:
+        total = 0
+        buckets = []
+        for bound, count in zip(self.BUCKETS + (float("inf"),), self.bucket_counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        # Linear interpolation inside the bucket that holds the q-th observation
+        if not self.count:
+            return None
+        rank = q * self.count
+        lower, seen = 0.0, 0
+        for bound, count in zip(self.BUCKETS, self.bucket_counts):
+            if seen + count >= rank:
+                return lower + (bound - lower) * ((rank - seen) / count if count else 0.0)
+            lower, seen = bound, seen + count
+        return self.BUCKETS[-1]
+
+# Per-request DB call counter; Motor copies the context into its executor threads
+request_db_calls: ContextVar[Optional[List[int]]] = ContextVar("request_db_calls", default=None)
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    # Motor runs pymongo on executor threads, so every mutation holds the lock
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[tuple, str] = {}
+        self.latency: Dict[tuple, LatencyHistogram] = {}
+        self.failures: Dict[tuple, int] = {}
+
+    def started(self, event):
+        target = event.command.get(event.command_name)
+        if not isinstance(target, str):
+            # getMore carries the cursor id under its own name
+            target = event.command.get("collection", "-")
+        calls = request_db_calls.get()
+        if calls is not None:
+            calls[0] += 1
+        with self._lock:
+            self._inflight[(event.connection_id, event.request_id)] = target
+
+    def _finish(self, event, failed: bool):
+        with self._lock:
+            collection = self._inflight.pop((event.connection_id, event.request_id), "-")
+            key = (collection, event.command_name)
+            self.latency.setdefault(key, LatencyHistogram()).observe(event.duration_micros / 1e6)
+            if failed:
+                self.failures[key] = self.failures.get(key, 0) + 1
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkout_started = threading.local()
+        self.checkout_wait: Dict[str, LatencyHistogram] = {}
+        self.checked_out: Dict[str, int] = {}
+        self.open_connections: Dict[str, int] = {}
+        self.checkout_failures: Dict[tuple, int] = {}
+        self.pool_clears: Dict[str, int] = {}
+
+    @staticmethod
+    def _address(event) -> str:
+        host, port = event.address
+        return f"{host}:{port}"
+
+    def _adjust(self, gauge: Dict, key: Any, amount: int):
+        with self._lock:
+            gauge[key] = gauge.get(key, 0) + amount
+
+    def _observe_wait(self, address: str):
+        # Check-out started and completed events fire on the same thread
+        started = getattr(self._checkout_started, address, None)
+        if started is None:
+            return
+        delattr(self._checkout_started, address)
+        with self._lock:
+            self.checkout_wait.setdefault(address, LatencyHistogram()).observe(time.perf_counter() - started)
+
+    def connection_check_out_started(self, event):
+        setattr(self._checkout_started, self._address(event), time.perf_counter())
+
+    def connection_checked_out(self, event):
+        address = self._address(event)
+        self._observe_wait(address)
+        self._adjust(self.checked_out, address, 1)
+
+    def connection_check_out_failed(self, event):
+        address = self._address(event)
+        self._observe_wait(address)
+        self._adjust(self.checkout_failures, (address, str(event.reason)), 1)
+
+    def connection_checked_in(self, event):
+        self._adjust(self.checked_out, self._address(event), -1)
+
+    def connection_created(self, event):
+        self._adjust(self.open_connections, self._address(event), 1)
+
+    def connection_closed(self, event):
+        self._adjust(self.open_connections, self._address(event), -1)
+
+    def pool_cleared(self, event):
+        self._adjust(self.pool_clears, self._address(event), 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checked_out": dict(self.checked_out),
+                "open_connections": dict(self.open_connections),
+                "checkout_wait_p95_seconds": {
+                    address: histogram.quantile(0.95) for address, histogram in self.checkout_wait.items()
+                },
+                "checkout_failures": sum(self.checkout_failures.values()),
+                "pool_clears": sum(self.pool_clears.values())
+            }
+
+mongo_command_metrics = MongoCommandMetrics()
+mongo_pool_metrics = MongoPoolMetrics()
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', 100))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', 0))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ['MONGO_MAX_IDLE_TIME_MS']) if os.environ.get('MONGO_MAX_IDLE_TIME_MS') else None
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ['MONGO_WAIT_QUEUE_TIMEOUT_MS']) if os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS') else None
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', 30000))
+MONGO_READ_PREFERENCE = os.environ.get('MONGO_READ_PREFERENCE', 'primary')
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+    waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    readPreference=MONGO_READ_PREFERENCE,
+    event_listeners=[mongo_command_metrics, mongo_pool_metrics]
+)
 db = client[os.environ['DB_NAME']]
 
 # Security
@@ -33,6 +224,88 @@ JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'your-super-secret-key')
 JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM', 'HS256')
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get('JWT_ACCESS_TOKEN_EXPIRE_MINUTES', 30))
 
+# Password Hashing Configuration
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 4))
+PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 64))
+
+# Index Configuration
+MONGO_CREATE_INDEXES = os.environ.get('MONGO_CREATE_INDEXES', 'true').lower() == 'true'
+
+# Job Search Configuration
+JOB_SEARCH_FACET_LIMIT = int(os.environ.get('JOB_SEARCH_FACET_LIMIT', 20))
+
+# HTTP Cache Configuration
+JOB_CACHE_CONTROL = os.environ.get('JOB_CACHE_CONTROL', 'public, max-age=60')
+JOB_LIST_CACHE_CONTROL = os.environ.get('JOB_LIST_CACHE_CONTROL', 'public, max-age=15')
+PRIVATE_CACHE_CONTROL = os.environ.get('PRIVATE_CACHE_CONTROL', 'private, no-cache')
+
+# Job Import Configuration
+JOB_IMPORT_CHUNK_SIZE = int(os.environ.get('JOB_IMPORT_CHUNK_SIZE', 1000))
+JOB_IMPORT_MAX_REPORTED_ERRORS = int(os.environ.get('JOB_IMPORT_MAX_REPORTED_ERRORS', 1000))
+# Longest CSV record (all of its lines) buffered before the record is rejected
+JOB_IMPORT_MAX_CSV_RECORD_BYTES = int(os.environ.get('JOB_IMPORT_MAX_CSV_RECORD_BYTES', 128 * 1024))
+
+# Application Export Configuration
+APPLICATION_EXPORT_BATCH_SIZE = int(os.environ.get('APPLICATION_EXPORT_BATCH_SIZE', 500))
+
+# People Search Configuration
+TYPEAHEAD_CANDIDATE_LIMIT = int(os.environ.get('TYPEAHEAD_CANDIDATE_LIMIT', 50))
+
+# Job Recommendation Configuration
+JOB_RECOMMENDER_REFRESH_SECONDS = float(os.environ.get('JOB_RECOMMENDER_REFRESH_SECONDS', 600))
+
+# Connection Graph Configuration
+GRAPH_REFRESH_SECONDS = float(os.environ.get('GRAPH_REFRESH_SECONDS', 300))
+GRAPH_SUGGESTION_MAX_NEIGHBORS = int(os.environ.get('GRAPH_SUGGESTION_MAX_NEIGHBORS', 2000))
+
+# Request Metrics Configuration
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+EXPOSE_DB_CALLS_HEADER = os.environ.get('EXPOSE_DB_CALLS_HEADER', 'false').lower() == 'true'
+SLOW_REQUEST_THRESHOLD_MS = float(os.environ.get('SLOW_REQUEST_THRESHOLD_MS', 500))
+PROFILE_SLOW_REQUESTS = os.environ.get('PROFILE_SLOW_REQUESTS', 'false').lower() == 'true'
+SLOW_REQUEST_PROFILE_LIMIT = int(os.environ.get('SLOW_REQUEST_PROFILE_LIMIT', 20))
+
+# Media Configuration
+UPLOAD_DIR = Path(os.environ.get('UPLOAD_DIR', ROOT_DIR / 'uploads'))
+MAX_UPLOAD_BYTES = int(os.environ.get('MAX_UPLOAD_BYTES', 5 * 1024 * 1024))
+MAX_IMAGE_PIXELS = int(os.environ.get('MAX_IMAGE_PIXELS', 25_000_000))
+THUMBNAIL_SIZES = [int(size) for size in os.environ.get('THUMBNAIL_SIZES', '64,256').split(',')]
+THUMBNAIL_WORKERS = int(os.environ.get('THUMBNAIL_WORKERS', 2))
+MEDIA_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Event Hub Configuration
+EVENT_HUB_BACKEND = os.environ.get('EVENT_HUB_BACKEND', 'memory')
+EVENT_HUB_CAPPED_BYTES = int(os.environ.get('EVENT_HUB_CAPPED_BYTES', 16 * 1024 * 1024))
+EVENT_QUEUE_SIZE = int(os.environ.get('EVENT_QUEUE_SIZE', 100))
+EVENT_HEARTBEAT_SECONDS = float(os.environ.get('EVENT_HEARTBEAT_SECONDS', 15))
+EVENT_TICKET_TTL_SECONDS = int(os.environ.get('EVENT_TICKET_TTL_SECONDS', 60))
+# Tickets carry their own audience so they are rejected as API tokens, and API tokens as tickets
+EVENT_TICKET_AUDIENCE = "linkdev:events"
+
+# Counter Buffer Configuration
+COUNTER_FLUSH_INTERVAL_SECONDS = float(os.environ.get('COUNTER_FLUSH_INTERVAL_SECONDS', 2))
+COUNTER_MAX_PENDING_DOCUMENTS = int(os.environ.get('COUNTER_MAX_PENDING_DOCUMENTS', 10000))
+
+# User Stats Configuration
+USER_STATS_RECONCILE_SECONDS = float(os.environ.get('USER_STATS_RECONCILE_SECONDS', 3600))
+
+# Admin Stats Configuration
+ADMIN_STATS_REFRESH_SECONDS = float(os.environ.get('ADMIN_STATS_REFRESH_SECONDS', 60))
+ADMIN_STATS_HISTORY_SIZE = int(os.environ.get('ADMIN_STATS_HISTORY_SIZE', 1440))
+
+# Cache Configuration
+USER_CACHE_MAX_SIZE = int(os.environ.get('USER_CACHE_MAX_SIZE', 10000))
+USER_CACHE_TTL_SECONDS = float(os.environ.get('USER_CACHE_TTL_SECONDS', 60))
+AUTHOR_CARD_CACHE_MAX_SIZE = int(os.environ.get('AUTHOR_CARD_CACHE_MAX_SIZE', 5000))
+AUTHOR_CARD_CACHE_TTL_SECONDS = float(os.environ.get('AUTHOR_CARD_CACHE_TTL_SECONDS', 30))
+
+# Feed Configuration
+FEED_TIMELINE_MAX_ENTRIES = int(os.environ.get('FEED_TIMELINE_MAX_ENTRIES', 800))
+FEED_FANOUT_MAX_CONNECTIONS = int(os.environ.get('FEED_FANOUT_MAX_CONNECTIONS', 5000))
+FEED_FANOUT_BATCH_SIZE = int(os.environ.get('FEED_FANOUT_BATCH_SIZE', 500))
+FEED_COMMENT_PREVIEW_SIZE = int(os.environ.get('FEED_COMMENT_PREVIEW_SIZE', 3))
+FEED_PULL_AUTHORS_REFRESH_SECONDS = float(os.environ.get('FEED_PULL_AUTHORS_REFRESH_SECONDS', 60))
+
 # Create the main app
 app = FastAPI(title="LINKDEV API", description="Professional Networking Platform", version="1.0.0")
 api_router = APIRouter(prefix="/api")
@@ -91,6 +364,30 @@ class UserProfile(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+class UserCard(BaseModel):
+    id: str
+    first_name: str
+    last_name: str
+    role: UserRole
+    headline: Optional[str] = None
+    location: Optional[str] = None
+    industry: Optional[str] = None
+    skills: List[str] = []
+    profile_picture: Optional[str] = None
+    connections_count: int = 0
+
+class TypeaheadHit(UserCard):
+    in_network: bool = False
+
+class ConnectionSuggestion(UserCard):
+    mutual_connections: int
+
+# Server-side projections so list views never ship password hashes or education/experience arrays
+USER_PUBLIC_PROJECTION = {"_id": 0, "password": 0, "search_tokens": 0}
+USER_CARD_PROJECTION = {"_id": 0, **{field: 1 for field in UserCard.model_fields}}
+
+USER_CARD_LIST = TypeAdapter(List[UserCard])
+
 class UserUpdate(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -134,6 +431,31 @@ class Job(BaseModel):
     applications_count: int = 0
     views_count: int = 0
 
+class JobSearchHit(Job):
+    score: float = 0.0
+
+class JobRecommendation(Job):
+    score: float
+
+class FacetBucket(BaseModel):
+    value: Any
+    count: int
+
+class JobSearchResponse(BaseModel):
+    results: List[JobSearchHit]
+    total: int
+    facets: Dict[str, List[FacetBucket]]
+
+class JobImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+class JobImportResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[JobImportRowError]
+    errors_truncated: bool
+
 class JobApplication(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     job_id: str
@@ -143,6 +465,16 @@ class JobApplication(BaseModel):
     applied_at: datetime = Field(default_factory=datetime.utcnow)
     reviewed_at: Optional[datetime] = None
 
+class RankedApplication(JobApplication):
+    applicant: Optional[UserCard] = None
+    score: float
+    skill_match: float
+    experience_fit: float
+
+class RankedApplications(BaseModel):
+    results: List[RankedApplication]
+    total: int
+
 # Connection Models
 class ConnectionRequest(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -167,6 +499,9 @@ class Post(BaseModel):
     comments_count: int = 0
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+class CommentCreate(BaseModel):
+    content: str
+
 class Comment(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     post_id: str
@@ -174,6 +509,11 @@ class Comment(BaseModel):
     content: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+class FeedPost(Post):
+    author: Optional[UserCard] = None
+    liked_by_me: bool = False
+    recent_comments: List[Comment] = []
+
 # Response Models
 class Token(BaseModel):
     access_token: str
@@ -185,13 +525,466 @@ class StatusCheck(BaseModel):
     client_name: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+# ============= CACHES =============
+
+class TTLCache:
+    # LRU-bounded mapping whose entries also expire after a fixed TTL
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *keys: str):
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+# Authenticated users by id; other workers see profile changes once the TTL expires
+user_cache = TTLCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS)
+
+# Projected UserCard documents for feed authors
+author_card_cache = TTLCache(AUTHOR_CARD_CACHE_MAX_SIZE, AUTHOR_CARD_CACHE_TTL_SECONDS)
+
+# ============= COUNTER BUFFER =============
+
+class CounterBuffer:
+    # Aggregates $inc deltas per document in memory and writes them with periodic bulk_write.
+    # At most flush_interval seconds (or max_pending documents) of increments are lost on a crash.
+    def __init__(self, flush_interval: float, max_pending: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[tuple, Dict[str, int]] = {}
+        self._flushing: Dict[tuple, Dict[str, int]] = {}
+        self._flush_in_progress = False
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flushes = 0
+        self.flushed_documents = 0
+        self.failures = 0
+
+    def incr(self, collection: str, doc_id: str, field: str, amount: int = 1):
+        deltas = self._pending.setdefault((collection, doc_id), {})
+        deltas[field] = deltas.get(field, 0) + amount
+        if len(self._pending) >= self.max_pending and not self._flush_in_progress:
+            if self._flush_task is None or self._flush_task.done():
+                # Keep a reference so the task isn't garbage-collected mid-flush
+                self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    def pending(self, collection: str, doc_id: str, field: str) -> int:
+        key = (collection, doc_id)
+        return self._flushing.get(key, {}).get(field, 0) + self._pending.get(key, {}).get(field, 0)
+
+    def overlay(self, collection: str, doc: Dict[str, Any]) -> Dict[str, Any]:
+        # Deltas still in memory (or being written) are added to the stored counts
+        key = (collection, doc["id"])
+        for source in (self._flushing, self._pending):
+            for field, delta in source.get(key, {}).items():
+                doc[field] = doc.get(field, 0) + delta
+        return doc
+
+    def _requeue(self, collection: str, doc_id: str, deltas: Dict[str, int]):
+        for field, delta in deltas.items():
+            self.incr(collection, doc_id, field, delta)
+
+    async def flush(self):
+        if self._flush_in_progress or not self._pending:
+            return
+        self._flush_in_progress = True
+        self._flushing, self._pending = self._pending, {}
+        try:
+            by_collection: Dict[str, List[tuple]] = {}
+            for (collection, doc_id), deltas in self._flushing.items():
+                by_collection.setdefault(collection, []).append((doc_id, deltas))
+
+            for collection, updates in by_collection.items():
+                operations = [UpdateOne({"id": doc_id}, {"$inc": deltas}) for doc_id, deltas in updates]
+                failed_updates = []
+                try:
+                    await db[collection].bulk_write(operations, ordered=False)
+                    self.flushed_documents += len(operations)
+                except BulkWriteError as e:
+                    # Only the failed updates are retried; the rest were applied
+                    self.failures += 1
+                    failed = {error["index"] for error in e.details.get("writeErrors", [])}
+                    failed_updates = [updates[index] for index in failed]
+                    self.flushed_documents += len(operations) - len(failed)
+                except Exception:
+                    self.failures += 1
+                    logger.exception(f"Counter flush to {collection} failed, retrying next cycle")
+                    failed_updates = updates
+                # Stored counts now include these deltas, so stop overlaying them right away
+                for doc_id, _ in updates:
+                    self._flushing.pop((collection, doc_id), None)
+                for update in failed_updates:
+                    self._requeue(collection, *update)
+            self.flushes += 1
+        except asyncio.CancelledError:
+            # Whatever is still in _flushing was not confirmed written; keep it for the final flush
+            for key, deltas in self._flushing.items():
+                pending = self._pending.setdefault(key, {})
+                for field, delta in deltas.items():
+                    pending[field] = pending.get(field, 0) + delta
+            raise
+        finally:
+            self._flushing = {}
+            self._flush_in_progress = False
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        # Wait for in-flight flushes so the final flush below isn't skipped as already running
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "flush_interval_seconds": self.flush_interval,
+            "max_pending_documents": self.max_pending,
+            "pending_documents": len(self._pending) + len(self._flushing),
+            "flushes": self.flushes,
+            "flushed_documents": self.flushed_documents,
+            "failures": self.failures
+        }
+
+counter_buffer = CounterBuffer(COUNTER_FLUSH_INTERVAL_SECONDS, COUNTER_MAX_PENDING_DOCUMENTS)
+
+# ============= PASSWORD HASHING =============
+
+class PasswordHasher:
+    # Runs bcrypt off the event loop; rejects work once max_pending calls are waiting
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def _run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, plain_password, hashed_password)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": min(self.pending, self.workers),
+            "queue_depth": max(self.pending - self.workers, 0),
+            "completed": self.completed,
+            "rejected": self.rejected
+        }
+
+password_hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
+
+# ============= EVENT HUB =============
+
+class InMemoryEventHub:
+    # Per-user bounded queues; a subscriber that falls behind loses events rather than stalling publishers
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, set] = {}
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def _deliver(self, user_ids: List[str], event: Dict[str, Any]):
+        for user_id in user_ids:
+            for queue in self._subscribers.get(user_id, ()):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    self.dropped += 1
+
+    async def publish(self, user_ids: List[str], event_type: str, data: Dict[str, Any]):
+        self.published += 1
+        self._deliver(user_ids, {
+            "id": str(uuid.uuid4()),
+            "type": event_type,
+            "data": data,
+            "created_at": datetime.utcnow().isoformat()
+        })
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "subscribed_users": len(self._subscribers),
+            "subscriptions": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self.published,
+            "dropped": self.dropped
+        }
+
+class MongoEventHub(InMemoryEventHub):
+    # Publishes into a capped collection that every worker tails, so subscribers on any worker see every event
+    def __init__(self, queue_size: int, capped_bytes: int):
+        super().__init__(queue_size)
+        self.capped_bytes = capped_bytes
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, user_ids: List[str], event_type: str, data: Dict[str, Any]):
+        self.published += 1
+        await db.events.insert_one({
+            "id": str(uuid.uuid4()),
+            "user_ids": user_ids,
+            "type": event_type,
+            "data": data,
+            "created_at": datetime.utcnow()
+        })
+
+    async def _tail(self):
+        # Start after the newest event so a restarted worker doesn't replay history
+        latest = await db.events.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+        last_id = latest["_id"] if latest else None
+        while True:
+            try:
+                cursor = db.events.find(
+                    {"_id": {"$gt": last_id}} if last_id else {},
+                    {"_id": 1, "id": 1, "user_ids": 1, "type": 1, "data": 1, "created_at": 1},
+                    cursor_type=CursorType.TAILABLE_AWAIT
+                )
+                async for event in cursor:
+                    last_id = event["_id"]
+                    self._deliver(event["user_ids"], {
+                        "id": event["id"],
+                        "type": event["type"],
+                        "data": event["data"],
+                        "created_at": event["created_at"].isoformat()
+                    })
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event hub tail failed")
+            # A tailable cursor on an empty capped collection dies immediately
+            await asyncio.sleep(1)
+
+    async def start(self):
+        try:
+            await db.create_collection("events", capped=True, size=self.capped_bytes)
+        except (CollectionInvalid, OperationFailure):
+            pass
+        self._task = asyncio.create_task(self._tail())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "backend": "mongo", "tailing": self._task is not None and not self._task.done()}
+
+if EVENT_HUB_BACKEND == "mongo":
+    event_hub = MongoEventHub(EVENT_QUEUE_SIZE, EVENT_HUB_CAPPED_BYTES)
+else:
+    event_hub = InMemoryEventHub(EVENT_QUEUE_SIZE)
+
+# ============= MEDIA STORAGE =============
+
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+]
+MEDIA_TYPES = {"jpg": "image/jpeg", "png": "image/png", "gif": "image/gif", "webp": "image/webp"}
+MEDIA_NAME_PATTERN = re.compile(r"^[0-9a-f]{64}(_[0-9]+)?\.(jpg|png|gif|webp)$")
+MEDIA_CHUNK_SIZE = 64 * 1024
+
+def detect_image_type(head: bytes) -> Optional[str]:
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return next((extension for signature, extension in IMAGE_SIGNATURES if head.startswith(signature)), None)
+
+def render_thumbnail(source: str, destination: str, size: int, max_pixels: int):
+    # Runs in a worker process; decoding and resampling are CPU-bound
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    with Image.open(source) as image:
+        # Pillow only raises past twice the limit, so reject anything over it before decoding
+        if image.width * image.height > max_pixels:
+            raise Image.DecompressionBombError(f"Image has {image.width * image.height} pixels, limit is {max_pixels}")
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((size, size))
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        # Write then rename so concurrent renders of the same hash never expose a partial file
+        partial = f"{destination}.{os.getpid()}.partial"
+        image.save(partial, "WEBP", quality=85)
+        os.replace(partial, destination)
+
+class MediaStore:
+    # Content-addressed files named by sha256, so identical uploads share one copy
+    def __init__(self, root: Path, max_bytes: int, thumbnail_workers: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.thumbnail_workers = thumbnail_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    async def save(self, upload: UploadFile) -> tuple:
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.root / f".upload-{uuid.uuid4()}"
+        digest = hashlib.sha256()
+        size = 0
+        extension = None
+        try:
+            with open(temp_path, "wb") as handle:
+                while True:
+                    chunk = await upload.read(MEDIA_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if extension is None:
+                        extension = detect_image_type(chunk[:16])
+                        if extension is None:
+                            raise HTTPException(status_code=415, detail="Unsupported image type, use JPEG, PNG, GIF or WebP")
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise HTTPException(status_code=413, detail=f"Image exceeds {self.max_bytes} bytes")
+                    digest.update(chunk)
+                    await asyncio.to_thread(handle.write, chunk)
+            if extension is None:
+                raise HTTPException(status_code=400, detail="Empty upload")
+
+            name = f"{digest.hexdigest()}.{extension}"
+            created = not self.path(name).exists()
+            if created:
+                os.replace(temp_path, self.path(name))
+            return name, created
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def start(self):
+        # Forking a process that already runs Motor, bcrypt and to_thread workers can deadlock the
+        # child on a lock some other thread held, so workers come from a clean forkserver instead
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.thumbnail_workers, mp_context=multiprocessing.get_context(method)
+        )
+
+    async def thumbnails(self, name: str) -> Dict[int, str]:
+        if self._pool is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        stem = name.rsplit(".", 1)[0]
+        names = {size: f"{stem}_{size}.webp" for size in THUMBNAIL_SIZES}
+        missing = {size: thumbnail for size, thumbnail in names.items() if not self.path(thumbnail).exists()}
+        try:
+            await asyncio.gather(*(
+                loop.run_in_executor(
+                    self._pool, render_thumbnail, str(self.path(name)), str(self.path(thumbnail)), size, MAX_IMAGE_PIXELS
+                )
+                for size, thumbnail in missing.items()
+            ))
+        except BaseException as e:
+            for thumbnail in missing.values():
+                self.path(thumbnail).unlink(missing_ok=True)
+            if isinstance(e, BrokenProcessPool):
+                # A crashed worker poisons the pool; start a fresh one on the next upload
+                self._pool = None
+            raise
+        return names
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+media_store = MediaStore(UPLOAD_DIR, MAX_UPLOAD_BYTES, THUMBNAIL_WORKERS)
+
 # ============= UTILITY FUNCTIONS =============
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password, hashed_password):
+    return await password_hasher.verify(plain_password, hashed_password)
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await password_hasher.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -203,6 +996,76 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
+def build_search_tokens(first_name: str, last_name: str, skills: List[str]) -> List[str]:
+    # Lowercased name and skill words, matched by anchored prefix regexes
+    tokens = set()
+    for value in [first_name, last_name] + list(skills or []):
+        normalized = (value or "").strip().lower()
+        if not normalized:
+            continue
+        tokens.add(normalized)
+        tokens.update(word for word in re.split(r"[\s\-/,]+", normalized) if word)
+    return sorted(tokens)
+
+def trusted_json_response(adapter: TypeAdapter, data: Any) -> Response:
+    # For models built with model_construct from projected Mongo documents: serialize
+    # in pydantic-core and skip FastAPI's response_model re-validation
+    return Response(content=adapter.dump_json(data, warnings=False), media_type="application/json")
+
+def encode_cursor(sort_value: datetime, item_id: str) -> str:
+    payload = json.dumps([sort_value.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, item_id = json.loads(payload)
+        return datetime.fromisoformat(sort_value), str(item_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_filter(sort_field: str, cursor: str) -> dict:
+    # Documents strictly after the cursor in (sort_field desc, id desc) order
+    sort_value, item_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {sort_field: {"$lt": sort_value}},
+            {sort_field: sort_value, "id": {"$lt": item_id}}
+        ]
+    }
+
+def page_offset(skip: int, cursor: Optional[str]) -> int:
+    # Offset paging is kept for older clients only; a cursor already marks the page start
+    return 0 if cursor else skip
+
+def set_next_cursor(response: Response, items: List[Dict[str, Any]], limit: int, sort_field: str):
+    if limit > 0 and len(items) == limit:
+        last = items[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last[sort_field], last["id"])
+
+def content_etag(value: Any) -> str:
+    # Weak because volatile counters such as views_count are left out of the hash
+    digest = hashlib.blake2b(json.dumps(value, sort_keys=True, default=str).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    # No Last-Modified: counters change without bumping a timestamp, so dates can't validate these bodies
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    # Compare weakly, as ETags here are weak
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+def set_cache_headers(response: Response, etag: str, cache_control: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, cache_control)
+    return response
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -218,10 +1081,152 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.PyJWTError:
         raise credentials_exception
     
-    user = await db.users.find_one({"id": user_id})
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
+
+    user = await db.users.find_one({"id": user_id}, USER_PUBLIC_PROJECTION)
     if user is None:
         raise credentials_exception
-    return UserProfile(**user)
+    user_profile = UserProfile(**user)
+    user_cache.set(user_id, user_profile)
+    return user_profile
+
+# ============= DATABASE INDEXES =============
+
+MONGO_INDEXES = {
+    "users": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        IndexModel([("role", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="role_created_at_id"),
+        IndexModel([("search_tokens", ASCENDING)], name="search_tokens"),
+    ],
+    "jobs": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("status", ASCENDING), ("posted_at", DESCENDING), ("id", DESCENDING)], name="status_posted_at_id"),
+        IndexModel([("posted_by", ASCENDING), ("posted_at", DESCENDING)], name="posted_by_posted_at"),
+        IndexModel(
+            [("title", TEXT), ("company", TEXT), ("description", TEXT)],
+            name="text_search",
+            weights={"title": 10, "company": 5, "description": 1}
+        ),
+    ],
+    "applications": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("job_id", ASCENDING), ("applicant_id", ASCENDING)], name="job_applicant_unique", unique=True),
+        IndexModel([("applicant_id", ASCENDING), ("applied_at", DESCENDING)], name="applicant_applied_at"),
+        IndexModel([("job_id", ASCENDING), ("applied_at", DESCENDING), ("id", DESCENDING)], name="job_applied_at_id"),
+    ],
+    "connections": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("sender_id", ASCENDING), ("receiver_id", ASCENDING)], name="sender_receiver"),
+        IndexModel([("sender_id", ASCENDING), ("status", ASCENDING)], name="sender_status"),
+        IndexModel([("receiver_id", ASCENDING), ("status", ASCENDING)], name="receiver_status"),
+        IndexModel([("status", ASCENDING)], name="status"),
+    ],
+    "posts": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        IndexModel([("author_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="author_created_at_id"),
+    ],
+    "comments": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("post_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="post_created_at_id"),
+    ],
+    "post_likes": [
+        IndexModel([("post_id", ASCENDING), ("user_id", ASCENDING)], name="post_user_unique", unique=True),
+        IndexModel([("user_id", ASCENDING), ("post_id", ASCENDING)], name="user_post"),
+    ],
+    "timelines": [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+    ],
+    "feed_pull_authors": [
+        IndexModel([("author_id", ASCENDING)], name="author_id_unique", unique=True),
+    ],
+    "user_stats": [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+    ],
+}
+
+# Query shapes issued by the endpoints, checked by the index report
+CANONICAL_QUERIES = [
+    {"name": "login", "collection": "users", "filter": {"email": "user@example.com"}},
+    {"name": "current_user", "collection": "users", "filter": {"id": "user-id"}},
+    {"name": "search_users_by_role", "collection": "users", "filter": {"role": UserRole.RECRUITER},
+     "sort": {"created_at": -1, "id": -1}},
+    {"name": "typeahead", "collection": "users", "filter": {"search_tokens": {"$regex": "^jan"}}},
+    {"name": "list_jobs", "collection": "jobs", "filter": {"status": JobStatus.ACTIVE},
+     "sort": {"posted_at": -1, "id": -1}},
+    {"name": "search_jobs", "collection": "jobs",
+     "filter": {"$text": {"$search": "python engineer"}, "status": JobStatus.ACTIVE}},
+    {"name": "job_by_id", "collection": "jobs", "filter": {"id": "job-id"}},
+    {"name": "recruiter_jobs", "collection": "jobs", "filter": {"posted_by": "user-id"}},
+    {"name": "existing_application", "collection": "applications",
+     "filter": {"job_id": "job-id", "applicant_id": "user-id"}},
+    {"name": "job_applications", "collection": "applications", "filter": {"job_id": "job-id"},
+     "sort": {"applied_at": -1, "id": -1}},
+    {"name": "applicant_applications", "collection": "applications", "filter": {"applicant_id": "user-id"}},
+    {"name": "existing_connection", "collection": "connections", "filter": {
+        "$or": [
+            {"sender_id": "user-a", "receiver_id": "user-b"},
+            {"sender_id": "user-b", "receiver_id": "user-a"}
+        ]
+    }},
+    {"name": "connection_requests", "collection": "connections",
+     "filter": {"receiver_id": "user-id", "status": ConnectionStatus.PENDING}},
+    {"name": "accepted_connections", "collection": "connections", "filter": {
+        "$or": [
+            {"sender_id": "user-id", "status": ConnectionStatus.ACCEPTED},
+            {"receiver_id": "user-id", "status": ConnectionStatus.ACCEPTED}
+        ]
+    }},
+    {"name": "connection_by_id", "collection": "connections",
+     "filter": {"id": "connection-id", "receiver_id": "user-id", "status": ConnectionStatus.PENDING}},
+    {"name": "posts_by_id", "collection": "posts", "filter": {"id": {"$in": ["post-a", "post-b"]}}},
+    {"name": "author_posts", "collection": "posts", "filter": {"author_id": {"$in": ["user-a", "user-b"]}},
+     "sort": {"created_at": -1, "id": -1}},
+    {"name": "post_comments", "collection": "comments", "filter": {"post_id": "post-id"},
+     "sort": {"created_at": -1, "id": -1}},
+    {"name": "post_like", "collection": "post_likes", "filter": {"post_id": "post-id", "user_id": "user-id"}},
+    {"name": "timeline", "collection": "timelines", "filter": {"user_id": "user-id"}},
+    {"name": "user_stats", "collection": "user_stats", "filter": {"user_id": "user-id"}},
+]
+
+async def create_indexes():
+    for collection_name, indexes in MONGO_INDEXES.items():
+        for index in indexes:
+            try:
+                await db[collection_name].create_indexes([index])
+            except OperationFailure as e:
+                # Existing duplicates or a conflicting definition must not block startup
+                logger.warning(f"Could not create index {collection_name}.{index.document['name']}: {e}")
+
+def collect_plan_stages(plan: Any) -> List[str]:
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(collect_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(collect_plan_stages(item))
+    return stages
+
+async def explain_query(query: Dict[str, Any]) -> Dict[str, Any]:
+    find_command = {"find": query["collection"], "filter": query["filter"], "limit": 20}
+    if "sort" in query:
+        find_command["sort"] = query["sort"]
+
+    explanation = await db.command({"explain": find_command, "verbosity": "queryPlanner"})
+    stages = collect_plan_stages(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+    return {
+        "name": query["name"],
+        "collection": query["collection"],
+        "stages": stages,
+        "collscan": "COLLSCAN" in stages
+    }
 
 # ============= AUTH ENDPOINTS =============
 
@@ -233,7 +1238,7 @@ async def register(user_data: UserCreate):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Hash password
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     
     # Create user profile
     user_profile = UserProfile(
@@ -246,7 +1251,14 @@ async def register(user_data: UserCreate):
     # Save to database
     user_dict = user_profile.dict()
     user_dict["password"] = hashed_password
-    await db.users.insert_one(user_dict)
+    user_dict["search_tokens"] = build_search_tokens(
+        user_profile.first_name, user_profile.last_name, user_profile.skills
+    )
+    try:
+        await db.users.insert_one(user_dict)
+    except DuplicateKeyError:
+        # A concurrent registration won the race past the find_one check
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create access token
     access_token_expires = timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -259,7 +1271,7 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=Token)
 async def login(user_credentials: UserLogin):
     user = await db.users.find_one({"email": user_credentials.email})
-    if not user or not verify_password(user_credentials.password, user["password"]):
+    if not user or not await verify_password(user_credentials.password, user["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -288,28 +1300,115 @@ async def update_user_profile(
 ):
     update_data = {k: v for k, v in user_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
+    if {"first_name", "last_name", "skills"} & update_data.keys():
+        update_data["search_tokens"] = build_search_tokens(
+            update_data.get("first_name", current_user.first_name),
+            update_data.get("last_name", current_user.last_name),
+            update_data.get("skills", current_user.skills)
+        )
     
-    await db.users.update_one(
+    updated_user = await db.users.find_one_and_update(
         {"id": current_user.id},
-        {"$set": update_data}
+        {"$set": update_data},
+        projection=USER_PUBLIC_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
+    user_cache.invalidate(current_user.id)
+    author_card_cache.invalidate(current_user.id)
     
-    updated_user = await db.users.find_one({"id": current_user.id})
-    return UserProfile(**{k: v for k, v in updated_user.items() if k != "password"})
+    return UserProfile(**updated_user)
+
+@api_router.post("/users/me/profile-picture")
+async def upload_profile_picture(
+    file: UploadFile = File(...),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    name, created = await media_store.save(file)
+    try:
+        thumbnails = await media_store.thumbnails(name)
+    except BaseException as e:
+        # Never leave an unreferenced original behind
+        if created:
+            media_store.path(name).unlink(missing_ok=True)
+        if isinstance(e, Image.DecompressionBombError):
+            raise HTTPException(status_code=400, detail=f"Image exceeds {MAX_IMAGE_PIXELS} pixels")
+        if isinstance(e, (UnidentifiedImageError, OSError, ValueError)):
+            # The magic bytes matched but the image itself doesn't decode
+            raise HTTPException(status_code=400, detail="Image could not be decoded")
+        if isinstance(e, BrokenProcessPool):
+            raise HTTPException(status_code=503, detail="Thumbnail workers unavailable, retry shortly")
+        raise
+
+    profile_picture = f"/api/media/{thumbnails[max(THUMBNAIL_SIZES)]}"
+    await db.users.update_one(
+        {"id": current_user.id},
+        {"$set": {"profile_picture": profile_picture, "updated_at": datetime.utcnow()}}
+    )
+    user_cache.invalidate(current_user.id)
+    author_card_cache.invalidate(current_user.id)
+
+    return {
+        "profile_picture": profile_picture,
+        "original": f"/api/media/{name}",
+        "thumbnails": {size: f"/api/media/{thumbnail}" for size, thumbnail in thumbnails.items()}
+    }
+
+@api_router.get("/users/typeahead", response_model=List[TypeaheadHit])
+async def typeahead_users(
+    q: str,
+    limit: int = Query(10, ge=1, le=TYPEAHEAD_CANDIDATE_LIMIT),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    terms = [term for term in re.split(r"\s+", q.strip().lower()) if term]
+    if not terms:
+        return []
+
+    # Anchored, case-sensitive prefixes on normalized tokens are index range scans
+    prefix_filter = [{"search_tokens": re.compile("^" + re.escape(term))} for term in terms]
+    candidates = await db.users.find(
+        {"$and": prefix_filter, "id": {"$ne": current_user.id}},
+        USER_CARD_PROJECTION
+    ).limit(TYPEAHEAD_CANDIDATE_LIMIT).to_list(TYPEAHEAD_CANDIDATE_LIMIT)
+
+    # Membership comes from the in-memory graph, so the viewer's network never goes to Mongo
+    await connection_graph.ensure_loaded()
+    network_ids = {user["id"] for user in candidates if connection_graph.connected(current_user.id, user["id"])}
+
+    full_query = " ".join(terms)
+    def rank(user: Dict[str, Any]) -> tuple:
+        full_name = f"{user['first_name']} {user['last_name']}".lower()
+        return (
+            user["id"] not in network_ids,
+            not full_name.startswith(full_query),
+            -user.get("connections_count", 0)
+        )
+
+    candidates.sort(key=rank)
+    return [TypeaheadHit(**user, in_network=user["id"] in network_ids) for user in candidates[:limit]]
 
 @api_router.get("/users/{user_id}", response_model=UserProfile)
-async def get_user_profile(user_id: str, current_user: UserProfile = Depends(get_current_user)):
-    user = await db.users.find_one({"id": user_id})
+async def get_user_profile(user_id: str, request: Request, current_user: UserProfile = Depends(get_current_user)):
+    user = await db.users.find_one({"id": user_id}, USER_PUBLIC_PROJECTION)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserProfile(**{k: v for k, v in user.items() if k != "password"})
 
-@api_router.get("/users", response_model=List[UserProfile])
+    # connections_count is incremented without touching updated_at
+    etag = content_etag([user["id"], user.get("updated_at"), user.get("connections_count", 0)])
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, PRIVATE_CACHE_CONTROL)
+
+    user_profile = UserProfile.model_construct(**user)
+    response = Response(content=user_profile.model_dump_json(warnings=False), media_type="application/json")
+    set_cache_headers(response, etag, PRIVATE_CACHE_CONTROL)
+    return response
+
+@api_router.get("/users", response_model=List[UserCard])
 async def search_users(
     query: Optional[str] = None,
     role: Optional[UserRole] = None,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     current_user: UserProfile = Depends(get_current_user)
 ):
     filter_dict = {}
@@ -323,8 +1422,169 @@ async def search_users(
     if role:
         filter_dict["role"] = role
     
-    users = await db.users.find(filter_dict).skip(skip).limit(limit).to_list(limit)
-    return [UserProfile(**{k: v for k, v in user.items() if k != "password"}) for user in users]
+    if cursor:
+        filter_dict = {"$and": [filter_dict, keyset_filter("created_at", cursor)]}
+
+    users = await db.users.find(
+        filter_dict,
+        {**USER_CARD_PROJECTION, "created_at": 1}
+    ).sort([("created_at", -1), ("id", -1)]).skip(page_offset(skip, cursor)).limit(limit).to_list(limit)
+
+    response = trusted_json_response(USER_CARD_LIST, [UserCard.model_construct(**user) for user in users])
+    set_next_cursor(response, users, limit, "created_at")
+    return response
+
+# ============= RELOADABLE INDEXES =============
+
+class ReloadableIndex(ABC):
+    # In-memory index rebuilt from Mongo by a background job; requests only ever wait for the first load.
+    # Mutations recorded while a rebuild reads its cursor are replayed onto the new snapshot before the swap.
+    def __init__(self):
+        self.loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._replay: Optional[List[tuple]] = None
+
+    def _record(self, method: str, *args):
+        if self._replay is not None:
+            self._replay.append((method, args))
+
+    @abstractmethod
+    async def _build(self) -> "ReloadableIndex":
+        ...
+
+    @abstractmethod
+    def _adopt(self, fresh: "ReloadableIndex"):
+        ...
+
+    async def _reload(self):
+        self._replay = []
+        try:
+            fresh = await self._build()
+            for method, args in self._replay:
+                getattr(fresh, method)(*args)
+            self._adopt(fresh)
+            self.loaded_at = time.monotonic()
+        finally:
+            self._replay = None
+
+    async def reload(self):
+        async with self._lock:
+            await self._reload()
+
+    async def ensure_loaded(self):
+        if self.loaded_at is not None:
+            return
+        async with self._lock:
+            if self.loaded_at is None:
+                await self._reload()
+
+    def age_seconds(self) -> Optional[float]:
+        return time.monotonic() - self.loaded_at if self.loaded_at is not None else None
+
+# ============= JOB RECOMMENDATIONS =============
+
+# Filler words in free-text requirements that would otherwise match every profile
+SKILL_STOPWORDS = {
+    "a", "an", "and", "or", "of", "the", "to", "in", "on", "for", "with", "at", "as", "is", "are", "be",
+    "years", "year", "yrs", "experience", "experienced", "knowledge", "strong", "good", "skills", "skill",
+    "ability", "familiarity", "understanding", "proficiency", "proficient", "plus", "preferred", "etc"
+}
+
+def skill_terms(values: List[str]) -> List[str]:
+    # Lowercased words that keep tech punctuation (c++, c#, node.js)
+    terms = set()
+    for value in values or []:
+        for word in re.findall(r"[a-z0-9][a-z0-9+#.]*", value.lower()):
+            word = word.rstrip(".")
+            if word and not word.isdigit() and word not in SKILL_STOPWORDS:
+                terms.add(word)
+    return sorted(terms)
+
+class JobRecommender(ReloadableIndex):
+    # Binary job x term matrix kept as int32 postings per term, scored by TF-IDF cosine
+    def __init__(self):
+        super().__init__()
+        self._terms: Dict[str, int] = {}
+        self._postings: List[array] = []
+        self._job_ids: List[str] = []
+        self._job_rows: Dict[str, int] = {}
+        self._norms: Optional[np.ndarray] = None
+        self._idf: Optional[np.ndarray] = None
+
+    def add_job(self, job_id: str, requirements: List[str]):
+        self._record("add_job", job_id, requirements)
+        if job_id in self._job_rows:
+            return
+        row = len(self._job_ids)
+        self._job_rows[job_id] = row
+        self._job_ids.append(job_id)
+        for term in skill_terms(requirements):
+            term_id = self._terms.get(term)
+            if term_id is None:
+                term_id = len(self._postings)
+                self._terms[term] = term_id
+                self._postings.append(array("i"))
+            self._postings[term_id].append(row)
+        # Document frequencies changed, so every job norm is stale
+        self._norms = None
+
+    def _weights(self):
+        if self._norms is None:
+            document_frequency = np.fromiter((len(rows) for rows in self._postings), dtype=np.float64, count=len(self._postings))
+            self._idf = np.log((1 + len(self._job_ids)) / (1 + document_frequency)) + 1
+            if self._postings:
+                rows = np.concatenate([np.frombuffer(rows, dtype=np.int32) for rows in self._postings])
+                squared = np.repeat(self._idf ** 2, document_frequency.astype(np.int64))
+                self._norms = np.sqrt(np.bincount(rows, weights=squared, minlength=len(self._job_ids)))
+            else:
+                self._norms = np.zeros(len(self._job_ids))
+        return self._idf, self._norms
+
+    def recommend(self, skills: List[str], limit: int, exclude: set) -> List[tuple]:
+        term_ids = [self._terms[term] for term in skill_terms(skills) if term in self._terms]
+        if not term_ids or not self._job_ids:
+            return []
+
+        idf, norms = self._weights()
+        scores = np.zeros(len(self._job_ids))
+        for term_id in term_ids:
+            # Rows within one posting list are unique, so fancy-index += is safe
+            scores[np.frombuffer(self._postings[term_id], dtype=np.int32)] += idf[term_id] ** 2
+        user_norm = np.sqrt(np.sum(idf[term_ids] ** 2))
+        np.divide(scores, norms * user_norm, out=scores, where=norms > 0)
+        for job_id in exclude:
+            row = self._job_rows.get(job_id)
+            if row is not None:
+                scores[row] = 0
+
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        top = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._job_ids[row], float(scores[row])) for row in top]
+
+    async def _build(self) -> "JobRecommender":
+        recommender = JobRecommender()
+        jobs = db.jobs.find({"status": JobStatus.ACTIVE}, {"_id": 0, "id": 1, "requirements": 1})
+        async for job in jobs:
+            recommender.add_job(job["id"], job.get("requirements", []))
+        return recommender
+
+    def _adopt(self, fresh: "JobRecommender"):
+        self._terms, self._postings = fresh._terms, fresh._postings
+        self._job_ids, self._job_rows = fresh._job_ids, fresh._job_rows
+        self._norms = self._idf = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "jobs": len(self._job_ids),
+            "terms": len(self._terms),
+            "postings": sum(len(rows) for rows in self._postings),
+            "age_seconds": self.age_seconds()
+        }
+
+# Rebuilt in the background every JOB_RECOMMENDER_REFRESH_SECONDS so closed jobs drop out; new jobs are added immediately
+job_recommender = JobRecommender()
 
 # ============= JOB ENDPOINTS =============
 
@@ -335,16 +1595,191 @@ async def create_job(job_data: JobCreate, current_user: UserProfile = Depends(ge
     
     job = Job(**job_data.dict(), posted_by=current_user.id)
     await db.jobs.insert_one(job.dict())
+    job_recommender.add_job(job.id, job.requirements)
+    await increment_user_stats(current_user.id, jobs_posted=1)
     return job
 
+async def iter_upload_lines(upload: UploadFile, chunk_size: int = 64 * 1024):
+    # Reads the spooled upload in chunks so memory stays flat regardless of file size
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+async def iter_ndjson_rows(upload: UploadFile):
+    row_number = 0
+    async for line in iter_upload_lines(upload):
+        row_number += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield row_number, None, "Expected a JSON object"
+            continue
+        yield row_number, row, None
+
+def parse_csv_job_row(header: List[str], values: List[str]) -> Dict[str, Any]:
+    row = {}
+    for field, value in zip(header, values):
+        value = value.strip()
+        if value == "":
+            continue
+        if field == "requirements":
+            row[field] = [item.strip() for item in re.split(r"[;|]", value) if item.strip()]
+        else:
+            row[field] = value
+    return row
+
+# A single field may use the whole record allowance
+csv.field_size_limit(max(csv.field_size_limit(), JOB_IMPORT_MAX_CSV_RECORD_BYTES))
+
+async def iter_csv_rows(upload: UploadFile):
+    lines = iter_upload_lines(upload)
+    replay: deque = deque()
+    header = None
+    record: List[str] = []
+    record_bytes = 0
+    in_quotes = False
+    row_number = 0
+    while True:
+        line = replay.popleft() if replay else await anext(lines, None)
+        if line is None and not record:
+            break
+        if line is not None:
+            # A quoted field may span lines; only the new line's quotes change the state
+            record.append(line)
+            record_bytes += len(line.encode()) + 1
+            if line.count('"') % 2:
+                in_quotes = not in_quotes
+            if in_quotes and record_bytes <= JOB_IMPORT_MAX_CSV_RECORD_BYTES:
+                continue
+
+        if in_quotes:
+            # Usually a stray quote: reject the line that opened it and re-read the lines it swallowed
+            replay.extendleft(reversed(record[1:]))
+            record, record_bytes, in_quotes = [], 0, False
+            row_number += 1
+            yield row_number, None, f"Unbalanced quote or record over {JOB_IMPORT_MAX_CSV_RECORD_BYTES} bytes"
+            continue
+
+        text, oversized = "\n".join(record), record_bytes > JOB_IMPORT_MAX_CSV_RECORD_BYTES
+        record, record_bytes = [], 0
+        if oversized:
+            row_number += 1
+            yield row_number, None, f"Record over {JOB_IMPORT_MAX_CSV_RECORD_BYTES} bytes"
+            continue
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as e:
+            row_number += 1
+            yield row_number, None, f"Invalid CSV: {e}"
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row_number, parse_csv_job_row(header, values), None
+
+@api_router.post("/jobs/import", response_model=JobImportResult)
+async def import_jobs(
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    current_user: UserProfile = Depends(get_current_user)
+):
+    if current_user.role not in [UserRole.RECRUITER, UserRole.ADMIN]:
+        raise HTTPException(status_code=403, detail="Only recruiters can post jobs")
+
+    file_format = (format or Path(file.filename or "").suffix.lstrip(".")).lower()
+    if file_format in ("ndjson", "jsonl"):
+        rows = iter_ndjson_rows(file)
+    elif file_format == "csv":
+        rows = iter_csv_rows(file)
+    else:
+        raise HTTPException(status_code=400, detail="Unsupported format, use ndjson or csv")
+
+    inserted = 0
+    failed = 0
+    errors: List[JobImportRowError] = []
+
+    def record_error(row_number: int, messages: List[str]):
+        nonlocal failed
+        failed += 1
+        if len(errors) < JOB_IMPORT_MAX_REPORTED_ERRORS:
+            errors.append(JobImportRowError(row=row_number, errors=messages))
+
+    async def write_chunk(chunk: List[tuple]):
+        nonlocal inserted
+        failed_indexes = set()
+        try:
+            result = await db.jobs.insert_many([job for _, job in chunk], ordered=False)
+            inserted += len(result.inserted_ids)
+        except BulkWriteError as e:
+            inserted += e.details.get("nInserted", 0)
+            for error in e.details.get("writeErrors", []):
+                failed_indexes.add(error["index"])
+                record_error(chunk[error["index"]][0], [error.get("errmsg", "Write failed")])
+        for index, (_, job) in enumerate(chunk):
+            if index not in failed_indexes:
+                job_recommender.add_job(job["id"], job["requirements"])
+
+    chunk = []
+    async for row_number, row, error in rows:
+        if error:
+            record_error(row_number, [error])
+            continue
+        try:
+            job_data = JobCreate(**row)
+        except ValidationError as e:
+            record_error(row_number, [
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()
+            ])
+            continue
+        chunk.append((row_number, Job(**job_data.dict(), posted_by=current_user.id).dict()))
+        if len(chunk) >= JOB_IMPORT_CHUNK_SIZE:
+            await write_chunk(chunk)
+            chunk = []
+    if chunk:
+        await write_chunk(chunk)
+
+    if inserted:
+        await increment_user_stats(current_user.id, jobs_posted=inserted)
+
+    return JobImportResult(
+        inserted=inserted,
+        failed=failed,
+        errors=errors,
+        errors_truncated=failed > len(errors)
+    )
+
 @api_router.get("/jobs", response_model=List[Job])
 async def get_jobs(
+    response: Response,
+    request: Request,
     query: Optional[str] = None,
     location: Optional[str] = None,
     job_type: Optional[str] = None,
     remote_allowed: Optional[bool] = None,
     skip: int = 0,
-    limit: int = 20
+    limit: int = 20,
+    cursor: Optional[str] = None
 ):
     filter_dict = {"status": JobStatus.ACTIVE}
     if query:
@@ -360,18 +1795,104 @@ async def get_jobs(
     if remote_allowed is not None:
         filter_dict["remote_allowed"] = remote_allowed
     
-    jobs = await db.jobs.find(filter_dict).skip(skip).limit(limit).to_list(limit)
-    return [Job(**job) for job in jobs]
+    if cursor:
+        filter_dict = {"$and": [filter_dict, keyset_filter("posted_at", cursor)]}
 
-@api_router.get("/jobs/{job_id}", response_model=Job)
-async def get_job(job_id: str):
-    # Increment view count
-    await db.jobs.update_one({"id": job_id}, {"$inc": {"views_count": 1}})
-    
-    job = await db.jobs.find_one({"id": job_id})
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return Job(**job)
+    jobs = await db.jobs.find(filter_dict).sort([("posted_at", -1), ("id", -1)]).skip(
+        page_offset(skip, cursor)
+    ).limit(limit).to_list(limit)
+    jobs = [counter_buffer.overlay("jobs", job) for job in jobs]
+    etag = content_etag([[job["id"], job.get("applications_count", 0)] for job in jobs])
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, JOB_LIST_CACHE_CONTROL)
+
+    set_next_cursor(response, jobs, limit, "posted_at")
+    set_cache_headers(response, etag, JOB_LIST_CACHE_CONTROL)
+    return [Job(**job) for job in jobs]
+
+@api_router.get("/jobs/search", response_model=JobSearchResponse)
+async def search_jobs(
+    query: str,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    remote_allowed: Optional[bool] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
+):
+    match = {"$text": {"$search": query}, "status": JobStatus.ACTIVE}
+    if location:
+        match["location"] = {"$regex": location, "$options": "i"}
+    if job_type:
+        match["job_type"] = job_type
+    if remote_allowed is not None:
+        match["remote_allowed"] = remote_allowed
+
+    pipeline = [
+        {"$match": match},
+        {"$addFields": {"score": {"$meta": "textScore"}}},
+        {"$facet": {
+            "results": [
+                {"$sort": {"score": -1, "posted_at": -1, "id": -1}},
+                {"$skip": skip},
+                {"$limit": limit}
+            ],
+            "total": [{"$count": "count"}],
+            "location": [{"$sortByCount": "$location"}, {"$limit": JOB_SEARCH_FACET_LIMIT}],
+            "job_type": [{"$sortByCount": "$job_type"}, {"$limit": JOB_SEARCH_FACET_LIMIT}],
+            "remote_allowed": [{"$sortByCount": "$remote_allowed"}]
+        }}
+    ]
+    result = (await db.jobs.aggregate(pipeline).to_list(1))[0]
+
+    return JobSearchResponse(
+        results=[JobSearchHit(**counter_buffer.overlay("jobs", job)) for job in result["results"]],
+        total=result["total"][0]["count"] if result["total"] else 0,
+        facets={
+            facet: [FacetBucket(value=bucket["_id"], count=bucket["count"]) for bucket in result[facet]]
+            for facet in ("location", "job_type", "remote_allowed")
+        }
+    )
+
+@api_router.get("/jobs/recommended", response_model=List[JobRecommendation])
+async def get_recommended_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    await job_recommender.ensure_loaded()
+    applications = await db.applications.find(
+        {"applicant_id": current_user.id}, {"_id": 0, "job_id": 1}
+    ).to_list(None)
+    exclude = {application["job_id"] for application in applications}
+
+    # The profile comes from get_current_user, so skill edits apply on the next request
+    ranked = job_recommender.recommend(current_user.skills, limit, exclude)
+    if not ranked:
+        return []
+
+    jobs = await db.jobs.find(
+        {"id": {"$in": [job_id for job_id, _ in ranked]}, "status": JobStatus.ACTIVE}, {"_id": 0}
+    ).to_list(len(ranked))
+    jobs_by_id = {job["id"]: job for job in jobs}
+    return [
+        JobRecommendation(**counter_buffer.overlay("jobs", jobs_by_id[job_id]), score=score)
+        for job_id, score in ranked if job_id in jobs_by_id
+    ]
+
+@api_router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str, request: Request, response: Response):
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Increment view count
+    counter_buffer.incr("jobs", job_id, "views_count")
+    job = counter_buffer.overlay("jobs", job)
+    etag = content_etag({field: value for field, value in job.items() if field != "views_count"})
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, JOB_CACHE_CONTROL)
+
+    set_cache_headers(response, etag, JOB_CACHE_CONTROL)
+    return Job(**job)
 
 @api_router.post("/jobs/{job_id}/apply")
 async def apply_to_job(
@@ -398,23 +1919,300 @@ async def apply_to_job(
         applicant_id=current_user.id,
         cover_letter=cover_letter
     )
-    await db.applications.insert_one(application.dict())
+    try:
+        await db.applications.insert_one(application.dict())
+    except DuplicateKeyError:
+        # A double-submit raced past the find_one check; job_applicant_unique rejected it
+        raise HTTPException(status_code=400, detail="Already applied to this job")
     
     # Increment applications count
-    await db.jobs.update_one({"id": job_id}, {"$inc": {"applications_count": 1}})
+    counter_buffer.incr("jobs", job_id, "applications_count")
+    await increment_user_stats(current_user.id, applications_sent=1)
+    await increment_user_stats(job["posted_by"], applications_received=1)
+    await event_hub.publish([job["posted_by"]], "job_application", {
+        "job_id": job_id,
+        "job_title": job["title"],
+        "application_id": application.id,
+        "applicant_id": current_user.id,
+        "applicant_name": f"{current_user.first_name} {current_user.last_name}"
+    })
     
     return {"message": "Application submitted successfully"}
 
 @api_router.get("/jobs/{job_id}/applications", response_model=List[JobApplication])
-async def get_job_applications(job_id: str, current_user: UserProfile = Depends(get_current_user)):
+async def get_job_applications(
+    job_id: str,
+    response: Response,
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: UserProfile = Depends(get_current_user)
+):
     # Check if user owns this job
-    job = await db.jobs.find_one({"id": job_id, "posted_by": current_user.id})
+    job = await db.jobs.find_one({"id": job_id, "posted_by": current_user.id}, {"_id": 0, "id": 1})
     if not job:
         raise HTTPException(status_code=403, detail="Not authorized to view applications")
     
-    applications = await db.applications.find({"job_id": job_id}).to_list(1000)
+    filter_dict = {"job_id": job_id}
+    if cursor:
+        filter_dict = {"$and": [filter_dict, keyset_filter("applied_at", cursor)]}
+
+    applications = await db.applications.find(filter_dict, {"_id": 0}).sort(
+        [("applied_at", -1), ("id", -1)]
+    ).limit(limit).to_list(limit)
+    set_next_cursor(response, applications, limit, "applied_at")
     return [JobApplication(**app) for app in applications]
 
+# Years of experience each job level expects; open-ended levels have no upper bound
+EXPERIENCE_LEVEL_YEARS = {
+    "intern": (0, 1), "entry": (0, 2), "junior": (0, 2), "mid": (2, 5),
+    "senior": (5, 10), "lead": (8, None), "principal": (10, None), "executive": (10, None)
+}
+APPLICANT_SKILL_WEIGHT = 0.75
+
+def experience_fit(experience_level: str, years: np.ndarray) -> np.ndarray:
+    level = experience_level.lower()
+    bounds = next((bounds for key, bounds in EXPERIENCE_LEVEL_YEARS.items() if key in level), None)
+    if bounds is None:
+        return np.ones(years.size)
+    low, high = bounds
+    # Lose a third per missing year, and a tenth per surplus year (capped) for over-qualification
+    fit = 1 - np.clip(low - years, 0, None) / 3
+    if high is not None:
+        fit -= np.minimum(np.clip(years - high, 0, None) / 10, 0.3)
+    fit = np.clip(fit, 0, 1)
+    # Applicants without experience_years get a neutral score
+    return np.where(np.isnan(years), 0.5, fit)
+
+def rank_applicants(job: Dict[str, Any], applicants: List[Dict[str, Any]]) -> tuple:
+    requirement_terms = set(skill_terms(job.get("requirements", [])))
+    # One entry per (applicant, matched requirement term), reduced with a single bincount
+    rows = [
+        row for row, applicant in enumerate(applicants)
+        for term in skill_terms(applicant.get("skills", [])) if term in requirement_terms
+    ]
+
+    if requirement_terms:
+        matched = np.bincount(np.array(rows, dtype=np.int64), minlength=len(applicants))
+        skill_match = matched / len(requirement_terms)
+    else:
+        skill_match = np.zeros(len(applicants))
+    years = np.array(
+        [applicant.get("experience_years") if applicant.get("experience_years") is not None else np.nan
+         for applicant in applicants],
+        dtype=np.float64
+    )
+    fit = experience_fit(job.get("experience_level", ""), years)
+    return APPLICANT_SKILL_WEIGHT * skill_match + (1 - APPLICANT_SKILL_WEIGHT) * fit, skill_match, fit
+
+@api_router.get("/jobs/{job_id}/applications/ranked", response_model=RankedApplications)
+async def get_ranked_job_applications(
+    job_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    job = await db.jobs.find_one(
+        {"id": job_id, "posted_by": current_user.id},
+        {"_id": 0, "id": 1, "requirements": 1, "experience_level": 1}
+    )
+    if not job:
+        raise HTTPException(status_code=403, detail="Not authorized to view applications")
+
+    applications = await db.applications.find({"job_id": job_id}, {"_id": 0}).sort(
+        [("applied_at", -1), ("id", -1)]
+    ).to_list(None)
+    if not applications:
+        return RankedApplications(results=[], total=0)
+
+    applicant_ids = list({application["applicant_id"] for application in applications})
+    users = await db.users.find(
+        {"id": {"$in": applicant_ids}},
+        {**USER_CARD_PROJECTION, "experience_years": 1}
+    ).to_list(len(applicant_ids))
+    users_by_id = {user["id"]: user for user in users}
+    applicants = [users_by_id.get(application["applicant_id"], {}) for application in applications]
+
+    scores, skill_match, fit = rank_applicants(job, applicants)
+    # Stable sort keeps the newest applications first among equal scores
+    page = np.argsort(-scores, kind="stable")[skip:skip + limit]
+    return RankedApplications(
+        results=[
+            RankedApplication(
+                **applications[i],
+                applicant=UserCard(**applicants[i]) if applicants[i] else None,
+                score=float(scores[i]),
+                skill_match=float(skill_match[i]),
+                experience_fit=float(fit[i])
+            )
+            for i in page
+        ],
+        total=len(applications)
+    )
+
+APPLICATION_EXPORT_FIELDS = [
+    "id", "job_id", "applicant_id", "applicant_name", "status", "applied_at", "reviewed_at", "cover_letter"
+]
+
+async def iter_application_batches(job_id: str):
+    applications = db.applications.find({"job_id": job_id}, {"_id": 0}).sort(
+        [("applied_at", -1), ("id", -1)]
+    ).batch_size(APPLICATION_EXPORT_BATCH_SIZE)
+
+    batch = []
+    async for application in applications:
+        batch.append(application)
+        if len(batch) >= APPLICATION_EXPORT_BATCH_SIZE:
+            yield await join_applicant_names(batch)
+            batch = []
+    if batch:
+        yield await join_applicant_names(batch)
+
+async def join_applicant_names(applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    applicant_ids = list({application["applicant_id"] for application in applications})
+    users = await db.users.find(
+        {"id": {"$in": applicant_ids}},
+        {"_id": 0, "id": 1, "first_name": 1, "last_name": 1}
+    ).to_list(len(applicant_ids))
+    names = {user["id"]: f"{user['first_name']} {user['last_name']}" for user in users}
+
+    rows = []
+    for application in applications:
+        row = {field: application.get(field) for field in APPLICATION_EXPORT_FIELDS}
+        row["applicant_name"] = names.get(application["applicant_id"])
+        for field in ("applied_at", "reviewed_at"):
+            if row[field] is not None:
+                row[field] = row[field].isoformat()
+        rows.append(row)
+    return rows
+
+async def stream_applications_ndjson(job_id: str):
+    async for rows in iter_application_batches(job_id):
+        yield "".join(json.dumps(row) + "\n" for row in rows)
+
+async def stream_applications_csv(job_id: str):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=APPLICATION_EXPORT_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async for rows in iter_application_batches(job_id):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+@api_router.get("/jobs/{job_id}/applications/export")
+async def export_job_applications(
+    job_id: str,
+    format: str = "ndjson",
+    current_user: UserProfile = Depends(get_current_user)
+):
+    job = await db.jobs.find_one({"id": job_id, "posted_by": current_user.id}, {"_id": 0, "id": 1})
+    if not job:
+        raise HTTPException(status_code=403, detail="Not authorized to view applications")
+
+    if format == "ndjson":
+        body, media_type = stream_applications_ndjson(job_id), "application/x-ndjson"
+    elif format == "csv":
+        body, media_type = stream_applications_csv(job_id), "text/csv"
+    else:
+        raise HTTPException(status_code=400, detail="Unsupported format, use ndjson or csv")
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="applications-{job_id}.{format}"'}
+    )
+
+# ============= CONNECTION GRAPH =============
+
+class ConnectionGraph(ReloadableIndex):
+    # Accepted connections as sorted int32 adjacency arrays over interned user ids
+    def __init__(self):
+        super().__init__()
+        self._index: Dict[str, int] = {}
+        self._user_ids: List[str] = []
+        self._adjacency: Dict[int, array] = {}
+
+    def _intern(self, user_id: str) -> int:
+        index = self._index.get(user_id)
+        if index is None:
+            index = len(self._user_ids)
+            self._index[user_id] = index
+            self._user_ids.append(user_id)
+        return index
+
+    def _neighbors(self, user_id: str) -> np.ndarray:
+        index = self._index.get(user_id)
+        if index is None or index not in self._adjacency:
+            return np.empty(0, dtype=np.int32)
+        return np.frombuffer(self._adjacency[index], dtype=np.int32)
+
+    def add_edge(self, user_a: str, user_b: str):
+        self._record("add_edge", user_a, user_b)
+        a, b = self._intern(user_a), self._intern(user_b)
+        for source, target in ((a, b), (b, a)):
+            neighbors = self._adjacency.setdefault(source, array("i"))
+            position = bisect_left(neighbors, target)
+            if position == len(neighbors) or neighbors[position] != target:
+                neighbors.insert(position, target)
+
+    def connected(self, user_a: str, user_b: str) -> bool:
+        neighbors = self._adjacency.get(self._index.get(user_a, -1))
+        target = self._index.get(user_b)
+        if neighbors is None or target is None:
+            return False
+        position = bisect_left(neighbors, target)
+        return position < len(neighbors) and neighbors[position] == target
+
+    def mutual_count(self, user_a: str, user_b: str) -> int:
+        return int(np.intersect1d(self._neighbors(user_a), self._neighbors(user_b), assume_unique=True).size)
+
+    def suggestions(self, user_id: str, limit: int, exclude: set) -> List[tuple]:
+        neighbors = self._neighbors(user_id)
+        if not neighbors.size:
+            return []
+
+        # Bound the work for very well-connected users
+        sampled = neighbors[:GRAPH_SUGGESTION_MAX_NEIGHBORS]
+        second_degree = np.concatenate([self._neighbors(self._user_ids[index]) for index in sampled])
+        if not second_degree.size:
+            return []
+
+        candidates, mutual_counts = np.unique(second_degree, return_counts=True)
+        excluded = np.fromiter(
+            [self._index[user_id]] + [self._index[other] for other in exclude if other in self._index],
+            dtype=np.int32
+        )
+        keep = ~np.isin(candidates, neighbors) & ~np.isin(candidates, excluded)
+        candidates, mutual_counts = candidates[keep], mutual_counts[keep]
+
+        top = np.argsort(-mutual_counts, kind="stable")[:limit]
+        return [(self._user_ids[candidates[i]], int(mutual_counts[i])) for i in top]
+
+    async def _build(self) -> "ConnectionGraph":
+        graph = ConnectionGraph()
+        connections = db.connections.find(
+            {"status": ConnectionStatus.ACCEPTED},
+            {"_id": 0, "sender_id": 1, "receiver_id": 1}
+        )
+        async for conn in connections:
+            graph.add_edge(conn["sender_id"], conn["receiver_id"])
+        return graph
+
+    def _adopt(self, fresh: "ConnectionGraph"):
+        self._index, self._user_ids, self._adjacency = fresh._index, fresh._user_ids, fresh._adjacency
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "users": len(self._user_ids),
+            "edges": sum(len(neighbors) for neighbors in self._adjacency.values()) // 2,
+            "age_seconds": self.age_seconds()
+        }
+
+# Rebuilt in the background every GRAPH_REFRESH_SECONDS; local accepts are applied immediately
+connection_graph = ConnectionGraph()
+
 # ============= CONNECTION ENDPOINTS =============
 
 @api_router.post("/connections/request")
@@ -442,6 +2240,12 @@ async def send_connection_request(
         message=message
     )
     await db.connections.insert_one(connection_request.dict())
+    await event_hub.publish([receiver_id], "connection_request", {
+        "connection_id": connection_request.id,
+        "sender_id": current_user.id,
+        "sender_name": f"{current_user.first_name} {current_user.last_name}",
+        "message": message
+    })
     
     return {"message": "Connection request sent"}
 
@@ -483,27 +2287,209 @@ async def respond_to_connection(
             {"id": current_user.id},
             {"$inc": {"connections_count": 1}}
         )
+        user_cache.invalidate(connection["sender_id"], current_user.id)
+        author_card_cache.invalidate(connection["sender_id"], current_user.id)
+        connection_graph.add_edge(connection["sender_id"], current_user.id)
+        await increment_user_stats(connection["sender_id"], connections=1)
+        await increment_user_stats(current_user.id, connections=1)
+        # Both timelines now miss the other user's history
+        await invalidate_timelines([connection["sender_id"], current_user.id])
+
+    await event_hub.publish([connection["sender_id"]], "connection_response", {
+        "connection_id": connection_id,
+        "accepted": accept,
+        "user_id": current_user.id,
+        "user_name": f"{current_user.first_name} {current_user.last_name}"
+    })
     
     return {"message": f"Connection request {'accepted' if accept else 'declined'}"}
 
-@api_router.get("/connections", response_model=List[UserProfile])
+@api_router.get("/connections", response_model=List[UserCard])
 async def get_connections(current_user: UserProfile = Depends(get_current_user)):
-    connections = await db.connections.find({
-        "$or": [
-            {"sender_id": current_user.id, "status": ConnectionStatus.ACCEPTED},
-            {"receiver_id": current_user.id, "status": ConnectionStatus.ACCEPTED}
-        ]
-    }).to_list(1000)
-    
-    connection_user_ids = []
-    for conn in connections:
-        if conn["sender_id"] == current_user.id:
-            connection_user_ids.append(conn["receiver_id"])
-        else:
-            connection_user_ids.append(conn["sender_id"])
-    
-    users = await db.users.find({"id": {"$in": connection_user_ids}}).to_list(1000)
-    return [UserProfile(**{k: v for k, v in user.items() if k != "password"}) for user in users]
+    connection_user_ids = await get_connection_ids(current_user.id)
+    if not connection_user_ids:
+        return []
+
+    users = await db.users.find({"id": {"$in": connection_user_ids}}, USER_CARD_PROJECTION).to_list(None)
+    return trusted_json_response(USER_CARD_LIST, [UserCard.model_construct(**user) for user in users])
+
+@api_router.get("/connections/mutual")
+async def get_mutual_connection_counts(
+    user_ids: List[str] = Query(...),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    await connection_graph.ensure_loaded()
+    return {user_id: connection_graph.mutual_count(current_user.id, user_id) for user_id in user_ids}
+
+@api_router.get("/connections/suggestions", response_model=List[ConnectionSuggestion])
+async def get_connection_suggestions(limit: int = 10, current_user: UserProfile = Depends(get_current_user)):
+    await connection_graph.ensure_loaded()
+
+    # Pending or declined requests in either direction are not suggested again
+    existing = await db.connections.find(
+        {"$or": [{"sender_id": current_user.id}, {"receiver_id": current_user.id}]},
+        {"_id": 0, "sender_id": 1, "receiver_id": 1}
+    ).to_list(None)
+    exclude = {conn["sender_id"] for conn in existing} | {conn["receiver_id"] for conn in existing}
+
+    ranked = connection_graph.suggestions(current_user.id, limit, exclude)
+    if not ranked:
+        return []
+
+    users = await db.users.find({"id": {"$in": [user_id for user_id, _ in ranked]}}, USER_CARD_PROJECTION).to_list(len(ranked))
+    users_by_id = {user["id"]: user for user in users}
+    return [
+        ConnectionSuggestion(**users_by_id[user_id], mutual_connections=mutual)
+        for user_id, mutual in ranked
+        if user_id in users_by_id
+    ]
+
+# ============= FEED FUNCTIONS =============
+
+async def get_connection_ids(user_id: str) -> List[str]:
+    connections = await db.connections.find(
+        {
+            "$or": [
+                {"sender_id": user_id, "status": ConnectionStatus.ACCEPTED},
+                {"receiver_id": user_id, "status": ConnectionStatus.ACCEPTED}
+            ]
+        },
+        {"_id": 0, "sender_id": 1, "receiver_id": 1}
+    ).to_list(None)
+    return [
+        conn["receiver_id"] if conn["sender_id"] == user_id else conn["sender_id"]
+        for conn in connections
+    ]
+
+async def push_timeline_entries(user_ids: List[str], entries: List[Dict[str, Any]]):
+    operations = [
+        UpdateOne(
+            {"user_id": user_id},
+            {
+                "$push": {
+                    "entries": {
+                        "$each": entries,
+                        "$sort": {"created_at": -1},
+                        "$slice": FEED_TIMELINE_MAX_ENTRIES
+                    }
+                }
+            },
+            upsert=True
+        )
+        for user_id in user_ids
+    ]
+    for start in range(0, len(operations), FEED_FANOUT_BATCH_SIZE):
+        await db.timelines.bulk_write(operations[start:start + FEED_FANOUT_BATCH_SIZE], ordered=False)
+
+class PullAuthors:
+    # Authors too well-connected to fan out, kept in process so feed reads skip a distinct() per request
+    def __init__(self):
+        self.ids: set = set()
+        self.loaded_at: Optional[float] = None
+
+    async def refresh(self):
+        self.ids = set(await db.feed_pull_authors.distinct("author_id"))
+        self.loaded_at = time.monotonic()
+
+    async def ensure_loaded(self):
+        if self.loaded_at is None:
+            await self.refresh()
+
+    async def add(self, author_id: str):
+        await db.feed_pull_authors.update_one(
+            {"author_id": author_id},
+            {"$set": {"author_id": author_id, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        self.ids.add(author_id)
+
+# Other workers pick up new pull authors every FEED_PULL_AUTHORS_REFRESH_SECONDS
+pull_authors = PullAuthors()
+
+async def fan_out_post(post: Post):
+    # The author's own timeline is written inline by create_post
+    connection_ids = await get_connection_ids(post.author_id)
+    if len(connection_ids) > FEED_FANOUT_MAX_CONNECTIONS:
+        # Too many timelines to write; readers pull this author's posts instead
+        await pull_authors.add(post.author_id)
+    else:
+        await push_timeline_entries(connection_ids, [{"post_id": post.id, "created_at": post.created_at}])
+
+fan_out_tasks: set = set()
+
+def finish_fan_out(task: asyncio.Task):
+    fan_out_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Post fan-out failed", exc_info=task.exception())
+
+def schedule_fan_out(post: Post):
+    # Post creation latency shouldn't grow with the author's connection count
+    task = asyncio.create_task(fan_out_post(post))
+    fan_out_tasks.add(task)
+    task.add_done_callback(finish_fan_out)
+
+async def invalidate_timelines(user_ids: List[str]):
+    await db.timelines.update_many({"user_id": {"$in": user_ids}}, {"$set": {"built": False}})
+
+async def rebuild_timeline(user_id: str) -> List[Dict[str, Any]]:
+    author_ids = [user_id] + await get_connection_ids(user_id)
+    posts = await db.posts.find(
+        {"author_id": {"$in": author_ids}},
+        {"_id": 0, "id": 1, "created_at": 1}
+    ).sort("created_at", -1).limit(FEED_TIMELINE_MAX_ENTRIES).to_list(FEED_TIMELINE_MAX_ENTRIES)
+
+    entries = [{"post_id": post["id"], "created_at": post["created_at"]} for post in posts]
+    await db.timelines.update_one(
+        {"user_id": user_id},
+        {"$set": {"entries": entries, "built": True, "rebuilt_at": datetime.utcnow()}},
+        upsert=True
+    )
+    return entries
+
+async def get_pulled_entries(user_id: str, count: int, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+    await pull_authors.ensure_loaded()
+    if not pull_authors.ids:
+        return []
+
+    # Checked against the in-memory graph so readers outside these networks pay no extra round trip
+    await connection_graph.ensure_loaded()
+    author_ids = [author_id for author_id in pull_authors.ids if connection_graph.connected(user_id, author_id)]
+    if not author_ids:
+        return []
+
+    filter_dict = {"author_id": {"$in": author_ids}}
+    if cursor:
+        filter_dict = {"$and": [filter_dict, keyset_filter("created_at", cursor)]}
+
+    posts = await db.posts.find(
+        filter_dict,
+        {"_id": 0, "id": 1, "created_at": 1}
+    ).sort([("created_at", -1), ("id", -1)]).limit(count).to_list(count)
+    return [{"post_id": post["id"], "created_at": post["created_at"]} for post in posts]
+
+async def read_timeline(user_id: str, count: int, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+    # Without a cursor only the head of the timeline is needed
+    projection = {"_id": 0, "built": 1, "entries": 1 if cursor else {"$slice": count}}
+    timeline = await db.timelines.find_one({"user_id": user_id}, projection)
+    if not timeline or not timeline.get("built"):
+        entries = await rebuild_timeline(user_id)
+    else:
+        entries = timeline.get("entries", [])
+
+    # Fan-out-on-read for authors whose posts were not pushed
+    pulled = await get_pulled_entries(user_id, count, cursor)
+    merged = {entry["post_id"]: entry for entry in entries + pulled}
+    entries = sorted(
+        merged.values(),
+        key=lambda entry: (entry["created_at"], entry["post_id"]),
+        reverse=True
+    )
+
+    if cursor:
+        before = decode_cursor(cursor)
+        entries = [entry for entry in entries if (entry["created_at"], entry["post_id"]) < before]
+
+    return entries[:count]
 
 # ============= POST ENDPOINTS =============
 
@@ -511,89 +2497,708 @@ async def get_connections(current_user: UserProfile = Depends(get_current_user))
 async def create_post(post_data: PostCreate, current_user: UserProfile = Depends(get_current_user)):
     post = Post(**post_data.dict(), author_id=current_user.id)
     await db.posts.insert_one(post.dict())
+    await increment_user_stats(current_user.id, posts=1)
+    await push_timeline_entries([current_user.id], [{"post_id": post.id, "created_at": post.created_at}])
+    schedule_fan_out(post)
     return post
 
+async def load_feed_page(
+    response: Response,
+    user_id: str,
+    skip: int,
+    limit: int,
+    cursor: Optional[str]
+) -> List[Dict[str, Any]]:
+    offset = page_offset(skip, cursor)
+    page = (await read_timeline(user_id, offset + limit, cursor))[offset:]
+    if limit > 0 and len(page) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(page[-1]["created_at"], page[-1]["post_id"])
+
+    post_ids = [entry["post_id"] for entry in page]
+    if not post_ids:
+        return []
+
+    posts = await db.posts.find({"id": {"$in": post_ids}}, {"_id": 0}).to_list(len(post_ids))
+    posts_by_id = {post["id"]: post for post in posts}
+    return [
+        counter_buffer.overlay("posts", posts_by_id[post_id])
+        for post_id in post_ids
+        if post_id in posts_by_id
+    ]
+
+async def get_author_cards(author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    cards = {}
+    missing = []
+    for author_id in set(author_ids):
+        card = author_card_cache.get(author_id)
+        if card is None:
+            missing.append(author_id)
+        else:
+            cards[author_id] = card
+
+    if missing:
+        users = await db.users.find({"id": {"$in": missing}}, USER_CARD_PROJECTION).to_list(len(missing))
+        for user in users:
+            author_card_cache.set(user["id"], user)
+            cards[user["id"]] = user
+    return cards
+
 @api_router.get("/posts", response_model=List[Post])
-async def get_posts(skip: int = 0, limit: int = 20, current_user: UserProfile = Depends(get_current_user)):
-    posts = await db.posts.find().sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+async def get_posts(
+    response: Response,
+    request: Request,
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    current_user: UserProfile = Depends(get_current_user)
+):
+    posts = await load_feed_page(response, current_user.id, skip, limit, cursor)
+    etag = content_etag([[post["id"], post.get("likes_count", 0), post.get("comments_count", 0)] for post in posts])
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, PRIVATE_CACHE_CONTROL)
+
+    set_cache_headers(response, etag, PRIVATE_CACHE_CONTROL)
     return [Post(**post) for post in posts]
 
+@api_router.get("/posts/feed", response_model=List[FeedPost])
+async def get_feed(
+    response: Response,
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    current_user: UserProfile = Depends(get_current_user)
+):
+    posts = await load_feed_page(response, current_user.id, skip, limit, cursor)
+    if not posts:
+        return []
+
+    # One query each for authors (behind the card cache) and the viewer's likes
+    authors = await get_author_cards([post["author_id"] for post in posts])
+    post_ids = [post["id"] for post in posts]
+    likes = await db.post_likes.find(
+        {"user_id": current_user.id, "post_id": {"$in": post_ids}},
+        {"_id": 0, "post_id": 1}
+    ).to_list(len(post_ids))
+    liked_ids = {like["post_id"] for like in likes}
+
+    return [
+        FeedPost(
+            **post,
+            author=authors.get(post["author_id"]),
+            liked_by_me=post["id"] in liked_ids
+        )
+        for post in posts
+    ]
+
+async def add_like(post_id: str, user_id: str) -> bool:
+    # The unique (post_id, user_id) index makes concurrent likes collapse into one
+    try:
+        result = await db.post_likes.update_one(
+            {"post_id": post_id, "user_id": user_id},
+            {"$setOnInsert": {"id": str(uuid.uuid4()), "created_at": datetime.utcnow()}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        return False
+    return result.upserted_id is not None
+
+async def remove_like(post_id: str, user_id: str) -> bool:
+    result = await db.post_likes.delete_one({"post_id": post_id, "user_id": user_id})
+    return result.deleted_count == 1
+
+@api_router.get("/posts/liked")
+async def get_liked_posts(
+    post_ids: List[str] = Query(...),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    likes = await db.post_likes.find(
+        {"user_id": current_user.id, "post_id": {"$in": post_ids}},
+        {"_id": 0, "post_id": 1}
+    ).to_list(len(post_ids))
+    return {"liked": [like["post_id"] for like in likes]}
+
 @api_router.post("/posts/{post_id}/like")
-async def like_post(post_id: str, current_user: UserProfile = Depends(get_current_user)):
-    # Check if already liked
-    existing_like = await db.post_likes.find_one({
-        "post_id": post_id,
-        "user_id": current_user.id
-    })
-    
-    if existing_like:
-        # Unlike
-        await db.post_likes.delete_one({"post_id": post_id, "user_id": current_user.id})
-        await db.posts.update_one({"id": post_id}, {"$inc": {"likes_count": -1}})
-        return {"message": "Post unliked"}
+async def like_post(
+    post_id: str,
+    liked: Optional[bool] = None,
+    current_user: UserProfile = Depends(get_current_user)
+):
+    post = await db.posts.find_one({"id": post_id}, {"_id": 0, "id": 1, "author_id": 1, "likes_count": 1})
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    # An explicit target state costs one write; a plain toggle tries unlike first
+    if liked is True:
+        changed = await add_like(post_id, current_user.id)
+    elif liked is False:
+        changed = await remove_like(post_id, current_user.id)
     else:
-        # Like
-        await db.post_likes.insert_one({
-            "id": str(uuid.uuid4()),
+        changed = await remove_like(post_id, current_user.id)
+        liked = not changed
+        if liked:
+            changed = await add_like(post_id, current_user.id)
+
+    if changed:
+        counter_buffer.incr("posts", post_id, "likes_count", 1 if liked else -1)
+
+    likes_count = counter_buffer.overlay("posts", post)["likes_count"]
+    if changed and liked and post["author_id"] != current_user.id:
+        await event_hub.publish([post["author_id"]], "post_liked", {
             "post_id": post_id,
             "user_id": current_user.id,
-            "created_at": datetime.utcnow()
+            "user_name": f"{current_user.first_name} {current_user.last_name}",
+            "likes_count": likes_count
         })
-        await db.posts.update_one({"id": post_id}, {"$inc": {"likes_count": 1}})
-        return {"message": "Post liked"}
+
+    return {
+        "message": "Post liked" if liked else "Post unliked",
+        "liked": liked,
+        "likes_count": likes_count
+    }
+
+# ============= USER STATS =============
+
+async def increment_user_stats(user_id: str, **deltas: int):
+    # Missing documents are left for rebuild_user_stats so counts never start from a partial zero
+    await db.user_stats.update_one(
+        {"user_id": user_id},
+        {"$inc": deltas, "$set": {"updated_at": datetime.utcnow()}}
+    )
+
+async def rebuild_user_stats(user_id: str) -> Dict[str, Any]:
+    job_ids = [
+        job["id"] for job in await db.jobs.find({"posted_by": user_id}, {"_id": 0, "id": 1}).to_list(None)
+    ]
+    stats = {
+        "connections": await db.connections.count_documents({
+            "$or": [
+                {"sender_id": user_id, "status": ConnectionStatus.ACCEPTED},
+                {"receiver_id": user_id, "status": ConnectionStatus.ACCEPTED}
+            ]
+        }),
+        "posts": await db.posts.count_documents({"author_id": user_id}),
+        "jobs_posted": len(job_ids),
+        "applications_received": (
+            await db.applications.count_documents({"job_id": {"$in": job_ids}}) if job_ids else 0
+        ),
+        "applications_sent": await db.applications.count_documents({"applicant_id": user_id})
+    }
+    now = datetime.utcnow()
+    await db.user_stats.update_one(
+        {"user_id": user_id},
+        {"$set": {**stats, "updated_at": now, "reconciled_at": now}},
+        upsert=True
+    )
+    return stats
+
+async def count_by(collection: str, match: Dict[str, Any], field: str) -> Dict[str, int]:
+    pipeline = [{"$match": match}, {"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+    return {row["_id"]: row["count"] async for row in db[collection].aggregate(pipeline)}
+
+async def reconcile_user_stats() -> int:
+    # Recompute every user's stats from the source collections with grouped aggregations
+    posts = await count_by("posts", {}, "author_id")
+    jobs_posted = await count_by("jobs", {}, "posted_by")
+    applications_sent = await count_by("applications", {}, "applicant_id")
+    applications_by_job = await count_by("applications", {}, "job_id")
+    accepted = {"status": ConnectionStatus.ACCEPTED}
+    connections_sent = await count_by("connections", accepted, "sender_id")
+    connections_received = await count_by("connections", accepted, "receiver_id")
+
+    applications_received: Dict[str, int] = {}
+    async for job in db.jobs.find({}, {"_id": 0, "id": 1, "posted_by": 1}):
+        if job["id"] in applications_by_job:
+            applications_received[job["posted_by"]] = (
+                applications_received.get(job["posted_by"], 0) + applications_by_job[job["id"]]
+            )
+
+    now = datetime.utcnow()
+    operations = []
+    reconciled = 0
+    async for user in db.users.find({}, {"_id": 0, "id": 1}):
+        user_id = user["id"]
+        stats = {
+            "connections": connections_sent.get(user_id, 0) + connections_received.get(user_id, 0),
+            "posts": posts.get(user_id, 0),
+            "jobs_posted": jobs_posted.get(user_id, 0),
+            "applications_received": applications_received.get(user_id, 0),
+            "applications_sent": applications_sent.get(user_id, 0)
+        }
+        operations.append(UpdateOne(
+            {"user_id": user_id},
+            {"$set": {**stats, "updated_at": now, "reconciled_at": now}},
+            upsert=True
+        ))
+        if len(operations) >= 1000:
+            await db.user_stats.bulk_write(operations, ordered=False)
+            reconciled += len(operations)
+            operations = []
+    if operations:
+        await db.user_stats.bulk_write(operations, ordered=False)
+        reconciled += len(operations)
+    return reconciled
+
+@api_router.post("/posts/{post_id}/comments", response_model=Comment)
+async def create_comment(
+    post_id: str,
+    comment_data: CommentCreate,
+    current_user: UserProfile = Depends(get_current_user)
+):
+    comment = Comment(post_id=post_id, author_id=current_user.id, content=comment_data.content)
+
+    # Insert first so the post never counts a comment that doesn't exist
+    await db.comments.insert_one(comment.dict())
+
+    # Count and feed preview change in one atomic update on the post
+    result = await db.posts.update_one(
+        {"id": post_id},
+        {
+            "$inc": {"comments_count": 1},
+            "$push": {"recent_comments": {"$each": [comment.dict()], "$slice": -FEED_COMMENT_PREVIEW_SIZE}}
+        }
+    )
+    if result.matched_count == 0:
+        await db.comments.delete_one({"id": comment.id})
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    return comment
+
+@api_router.get("/posts/{post_id}/comments", response_model=List[Comment])
+async def get_comments(
+    post_id: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: UserProfile = Depends(get_current_user)
+):
+    filter_dict = {"post_id": post_id}
+    if cursor:
+        filter_dict = {"$and": [filter_dict, keyset_filter("created_at", cursor)]}
+
+    comments = await db.comments.find(filter_dict, {"_id": 0}).sort(
+        [("created_at", -1), ("id", -1)]
+    ).limit(limit).to_list(limit)
+    set_next_cursor(response, comments, limit, "created_at")
+    return [Comment(**comment) for comment in comments]
 
 # ============= DASHBOARD ENDPOINTS =============
 
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(current_user: UserProfile = Depends(get_current_user)):
     # Get user's stats
-    connections_count = await db.connections.count_documents({
-        "$or": [
-            {"sender_id": current_user.id, "status": ConnectionStatus.ACCEPTED},
-            {"receiver_id": current_user.id, "status": ConnectionStatus.ACCEPTED}
-        ]
-    })
-    
-    posts_count = await db.posts.count_documents({"author_id": current_user.id})
+    stats = await db.user_stats.find_one({"user_id": current_user.id}, {"_id": 0})
+    if stats is None:
+        stats = await rebuild_user_stats(current_user.id)
     
     if current_user.role == UserRole.RECRUITER:
-        jobs_count = await db.jobs.count_documents({"posted_by": current_user.id})
-        applications_count = await db.applications.count_documents({
-            "job_id": {"$in": [job["id"] for job in await db.jobs.find({"posted_by": current_user.id}).to_list(1000)]}
-        })
         return {
-            "connections": connections_count,
-            "posts": posts_count,
-            "jobs_posted": jobs_count,
-            "applications_received": applications_count
+            "connections": stats.get("connections", 0),
+            "posts": stats.get("posts", 0),
+            "jobs_posted": stats.get("jobs_posted", 0),
+            "applications_received": stats.get("applications_received", 0)
         }
     else:
-        applications_count = await db.applications.count_documents({"applicant_id": current_user.id})
         return {
-            "connections": connections_count,
-            "posts": posts_count,
-            "applications_sent": applications_count
+            "connections": stats.get("connections", 0),
+            "posts": stats.get("posts", 0),
+            "applications_sent": stats.get("applications_sent", 0)
         }
 
+# ============= ADMIN STATS =============
+
+# Rolling snapshots, newest last; served from memory between refreshes
+admin_stats_history = deque(maxlen=ADMIN_STATS_HISTORY_SIZE)
+
+async def compute_admin_stats(exact: bool = False) -> Dict[str, Any]:
+    async def total(collection: str) -> int:
+        # Metadata counts are O(1) but may drift after unclean shutdowns
+        if exact:
+            return await db[collection].count_documents({})
+        return await db[collection].estimated_document_count()
+
+    return {
+        "total_users": await total("users"),
+        "total_jobs": await total("jobs"),
+        "total_applications": await total("applications"),
+        "total_connections": await db.connections.count_documents({"status": ConnectionStatus.ACCEPTED}),
+        "total_posts": await total("posts"),
+        "generated_at": datetime.utcnow(),
+        "exact": exact
+    }
+
+async def refresh_admin_stats():
+    admin_stats_history.append(await compute_admin_stats())
+
+# ============= REQUEST METRICS =============
+
+class RequestMetrics:
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self):
+        self.latency: Dict[tuple, LatencyHistogram] = {}
+        self.responses: Dict[tuple, int] = {}
+        self.db_calls: Dict[tuple, int] = {}
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, db_calls: int):
+        key = (method, route)
+        self.latency.setdefault(key, LatencyHistogram()).observe(seconds)
+        self.responses[key + (status_code,)] = self.responses.get(key + (status_code,), 0) + 1
+        self.db_calls[key] = self.db_calls.get(key, 0) + db_calls
+
+request_metrics = RequestMetrics()
+
+class SlowRequestProfiler:
+    # cProfile hooks the whole event loop thread, so one request is profiled at a time
+    # and the capture also includes whatever else the loop ran meanwhile
+    def __init__(self, enabled: bool, threshold_ms: float, limit: int):
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.profiles: deque = deque(maxlen=limit)
+        self._active = False
+
+    def begin(self) -> Optional[cProfile.Profile]:
+        if not self.enabled or self._active:
+            return None
+        self._active = True
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def end(self, profile: cProfile.Profile, request: Request, route: str, duration_ms: float, db_calls: int):
+        profile.disable()
+        self._active = False
+        if duration_ms < self.threshold_ms:
+            return
+        output = io.StringIO()
+        pstats.Stats(profile, stream=output).sort_stats("cumulative").print_stats(40)
+        self.profiles.append({
+            "id": str(uuid.uuid4()),
+            "method": request.method,
+            "path": request.url.path,
+            "route": route,
+            "duration_ms": round(duration_ms, 2),
+            "db_calls": db_calls,
+            "captured_at": datetime.utcnow(),
+            "stats": output.getvalue()
+        })
+
+slow_request_profiler = SlowRequestProfiler(PROFILE_SLOW_REQUESTS, SLOW_REQUEST_THRESHOLD_MS, SLOW_REQUEST_PROFILE_LIMIT)
+
+# ============= MEDIA ENDPOINTS =============
+
+def parse_byte_range(header: str, size: int) -> Optional[tuple]:
+    # Single ranges only; multipart/byteranges isn't worth it for images
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    start, end = match.groups()
+    if start == "":
+        length = int(end)
+        if length == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start > end:
+        return None
+    return start, end
+
+async def iter_file_range(path: Path, start: int, end: int):
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(handle.read, min(MEDIA_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+@api_router.get("/media/{name}")
+async def get_media(name: str, request: Request):
+    if not MEDIA_NAME_PATTERN.match(name):
+        raise HTTPException(status_code=404, detail="Media not found")
+    path = media_store.path(name)
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Media not found")
+
+    # Content-addressed names never change, so the name is a strong validator
+    etag = f'"{name.split(".")[0]}"'
+    headers = {"ETag": etag, "Cache-Control": MEDIA_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if request.headers.get("if-none-match") in (etag, f"W/{etag}"):
+        return Response(status_code=304, headers=headers)
+
+    media_type = MEDIA_TYPES[name.rsplit(".", 1)[1]]
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        byte_range = parse_byte_range(range_header, size)
+        if byte_range is None:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        start, end = byte_range
+        return StreamingResponse(
+            iter_file_range(path, start, end),
+            status_code=206,
+            media_type=media_type,
+            headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(end - start + 1)}
+        )
+
+    return StreamingResponse(
+        iter_file_range(path, 0, size - 1),
+        media_type=media_type,
+        headers={**headers, "Content-Length": str(size)}
+    )
+
+# ============= EVENT ENDPOINTS =============
+
+def format_sse(event: Dict[str, Any]) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+async def stream_events(request: Request, user_id: str):
+    # Subscribing inside the generator ties the queue's lifetime to the open stream
+    queue = event_hub.subscribe(user_id)
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=EVENT_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment frames keep proxies from closing an idle stream
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event)
+    finally:
+        event_hub.unsubscribe(user_id, queue)
+
+@api_router.post("/events/ticket")
+async def create_event_ticket(current_user: UserProfile = Depends(get_current_user)):
+    # EventSource can't send an Authorization header, so the stream takes a short-lived ticket in the URL
+    ticket = create_access_token(
+        data={"sub": current_user.id, "aud": EVENT_TICKET_AUDIENCE},
+        expires_delta=timedelta(seconds=EVENT_TICKET_TTL_SECONDS)
+    )
+    return {"ticket": ticket, "expires_in": EVENT_TICKET_TTL_SECONDS}
+
+@api_router.get("/events/stream")
+async def get_event_stream(request: Request, ticket: str):
+    try:
+        payload = jwt.decode(ticket, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM], audience=EVENT_TICKET_AUDIENCE)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid or expired ticket")
+    user_id = payload.get("sub")
+    if user_id is None or await db.users.find_one({"id": user_id}, {"_id": 0, "id": 1}) is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired ticket")
+
+    return StreamingResponse(
+        stream_events(request, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# ============= METRICS ENDPOINTS =============
+
+def format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+def render_histograms(name: str, help_text: str, series: List[tuple]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, histogram in series:
+        for bound, count in histogram.cumulative():
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{format_labels({**labels, 'le': le})} {count}")
+        lines.append(f"{name}_sum{format_labels(labels)} {histogram.sum}")
+        lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+    return lines
+
+def render_samples(name: str, metric_type: str, help_text: str, series: List[tuple]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines.extend(f"{name}{format_labels(labels)} {value}" for labels, value in series)
+    return lines
+
+def render_request_metrics() -> List[str]:
+    lines = [
+        "# HELP linkdev_http_request_duration_seconds Request latency per route template.",
+        "# TYPE linkdev_http_request_duration_seconds summary"
+    ]
+    for (method, route), histogram in sorted(request_metrics.latency.items()):
+        labels = {"method": method, "route": route}
+        for q in RequestMetrics.QUANTILES:
+            value = histogram.quantile(q)
+            lines.append(f"linkdev_http_request_duration_seconds{format_labels({**labels, 'quantile': q})} {value}")
+        lines.append(f"linkdev_http_request_duration_seconds_sum{format_labels(labels)} {histogram.sum}")
+        lines.append(f"linkdev_http_request_duration_seconds_count{format_labels(labels)} {histogram.count}")
+
+    responses = [
+        ({"method": method, "route": route, "status": status_code}, count)
+        for (method, route, status_code), count in sorted(request_metrics.responses.items())
+    ]
+    db_calls = [
+        ({"method": method, "route": route}, count)
+        for (method, route), count in sorted(request_metrics.db_calls.items())
+    ]
+    return (
+        lines
+        + render_samples("linkdev_http_responses_total", "counter", "Responses per route and status.", responses)
+        + render_samples("linkdev_http_request_db_calls_total", "counter", "MongoDB commands issued per route.", db_calls)
+    )
+
+def render_database_metrics() -> List[str]:
+    with mongo_command_metrics._lock:
+        commands = [
+            ({"collection": collection, "command": command}, histogram)
+            for (collection, command), histogram in sorted(mongo_command_metrics.latency.items())
+        ]
+        command_failures = [
+            ({"collection": collection, "command": command}, count)
+            for (collection, command), count in sorted(mongo_command_metrics.failures.items())
+        ]
+    with mongo_pool_metrics._lock:
+        checkout_wait = [
+            ({"address": address}, histogram)
+            for address, histogram in sorted(mongo_pool_metrics.checkout_wait.items())
+        ]
+        checked_out = [({"address": address}, count) for address, count in sorted(mongo_pool_metrics.checked_out.items())]
+        open_connections = [
+            ({"address": address}, count) for address, count in sorted(mongo_pool_metrics.open_connections.items())
+        ]
+        checkout_failures = [
+            ({"address": address, "reason": reason}, count)
+            for (address, reason), count in sorted(mongo_pool_metrics.checkout_failures.items())
+        ]
+
+    return (
+        render_histograms("linkdev_mongo_command_duration_seconds", "MongoDB command latency.", commands)
+        + render_samples("linkdev_mongo_command_failures_total", "counter", "Failed MongoDB commands.", command_failures)
+        + render_histograms(
+            "linkdev_mongo_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.", checkout_wait
+        )
+        + render_samples("linkdev_mongo_pool_checked_out", "gauge", "Connections currently checked out.", checked_out)
+        + render_samples("linkdev_mongo_pool_connections", "gauge", "Open pooled connections.", open_connections)
+        + render_samples(
+            "linkdev_mongo_pool_checkout_failures_total", "counter", "Failed connection check-outs.", checkout_failures
+        )
+    )
+
+async def require_metrics_access(request: Request):
+    # Scrapers send METRICS_TOKEN as a bearer token; otherwise an admin JWT is required
+    token = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    if METRICS_TOKEN and hmac.compare_digest(token.encode(), METRICS_TOKEN.encode()):
+        return
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    current_user = await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+@api_router.get("/metrics", dependencies=[Depends(require_metrics_access)])
+async def get_metrics():
+    lines = render_request_metrics() + render_database_metrics()
+    return Response(content="\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
 # ============= ADMIN ENDPOINTS =============
 
 @api_router.get("/admin/stats")
-async def get_admin_stats(current_user: UserProfile = Depends(get_current_user)):
+async def get_admin_stats(fresh: bool = False, current_user: UserProfile = Depends(get_current_user)):
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    total_users = await db.users.count_documents({})
-    total_jobs = await db.jobs.count_documents({})
-    total_applications = await db.applications.count_documents({})
-    total_connections = await db.connections.count_documents({"status": ConnectionStatus.ACCEPTED})
-    total_posts = await db.posts.count_documents({})
-    
+    if fresh:
+        return await compute_admin_stats(exact=True)
+
+    if not admin_stats_history:
+        await refresh_admin_stats()
+    return admin_stats_history[-1]
+
+@api_router.get("/admin/stats/history")
+async def get_admin_stats_history(limit: int = 60, current_user: UserProfile = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    snapshots = list(admin_stats_history)
     return {
-        "total_users": total_users,
-        "total_jobs": total_jobs,
-        "total_applications": total_applications,
-        "total_connections": total_connections,
-        "total_posts": total_posts
+        "refresh_interval_seconds": ADMIN_STATS_REFRESH_SECONDS,
+        "snapshots": snapshots[-limit:] if limit > 0 else []
+    }
+
+@api_router.get("/admin/metrics")
+async def get_admin_metrics(current_user: UserProfile = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return {
+        "user_cache": user_cache.stats(),
+        "author_card_cache": author_card_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "connection_graph": connection_graph.stats(),
+        "job_recommender": job_recommender.stats(),
+        "counter_buffer": counter_buffer.stats(),
+        "event_hub": event_hub.stats(),
+        "mongo_pool": mongo_pool_metrics.stats()
+    }
+
+@api_router.get("/admin/profiles")
+async def get_slow_request_profiles(current_user: UserProfile = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return {
+        "enabled": slow_request_profiler.enabled,
+        "threshold_ms": slow_request_profiler.threshold_ms,
+        "profiles": [
+            {key: value for key, value in profile.items() if key != "stats"}
+            for profile in reversed(slow_request_profiler.profiles)
+        ]
+    }
+
+@api_router.put("/admin/profiles")
+async def configure_slow_request_profiling(
+    enabled: bool,
+    threshold_ms: Optional[float] = Query(None, ge=0),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    slow_request_profiler.enabled = enabled
+    if threshold_ms is not None:
+        slow_request_profiler.threshold_ms = threshold_ms
+    return {"enabled": slow_request_profiler.enabled, "threshold_ms": slow_request_profiler.threshold_ms}
+
+@api_router.get("/admin/profiles/{profile_id}")
+async def get_slow_request_profile(profile_id: str, current_user: UserProfile = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    for profile in slow_request_profiler.profiles:
+        if profile["id"] == profile_id:
+            return Response(content=profile["stats"], media_type="text/plain")
+    raise HTTPException(status_code=404, detail="Profile not found")
+
+@api_router.post("/admin/stats/reconcile")
+async def reconcile_dashboard_stats(current_user: UserProfile = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    reconciled = await reconcile_user_stats()
+    return {"message": "User stats reconciled", "users": reconciled}
+
+@api_router.get("/admin/indexes/report")
+async def get_index_report(current_user: UserProfile = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    queries = [await explain_query(query) for query in CANONICAL_QUERIES]
+    return {
+        "queries": queries,
+        "collscans": [query["name"] for query in queries if query["collscan"]]
     }
 
 # ============= LEGACY ENDPOINTS =============
@@ -616,6 +3221,35 @@ async def get_status_checks():
 # Include the router in the main app
 app.include_router(api_router)
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    calls = [0]
+    token = request_db_calls.set(calls)
+    profile = slow_request_profiler.begin()
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        duration = time.perf_counter() - started
+        request_db_calls.reset(token)
+        # Label by route template so path parameters don't explode cardinality
+        route = request.scope.get("route")
+        template = route.path if route else "unmatched"
+        request_metrics.observe(request.method, template, status_code, duration, calls[0])
+        if profile:
+            slow_request_profiler.end(profile, request, template, duration * 1000, calls[0])
+        if duration * 1000 >= slow_request_profiler.threshold_ms:
+            logger.warning(
+                f"Slow request {request.method} {template} took {duration * 1000:.1f}ms with {calls[0]} DB calls"
+            )
+
+    if EXPOSE_DB_CALLS_HEADER:
+        # Off by default; it leaks how much database work each public route does
+        response.headers["X-DB-Calls"] = str(calls[0])
+    return response
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -623,6 +3257,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"] + (["X-DB-Calls"] if EXPOSE_DB_CALLS_HEADER else []),
 )
 
 # Configure logging
@@ -632,6 +3267,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def ensure_indexes():
+    if MONGO_CREATE_INDEXES:
+        await create_indexes()
+
+@app.on_event("startup")
+async def backfill_search_tokens():
+    # Users created before typeahead existed have no search_tokens yet
+    users = db.users.find(
+        {"search_tokens": {"$exists": False}},
+        {"_id": 0, "id": 1, "first_name": 1, "last_name": 1, "skills": 1}
+    )
+    operations = []
+    async for user in users:
+        tokens = build_search_tokens(user.get("first_name"), user.get("last_name"), user.get("skills", []))
+        operations.append(UpdateOne({"id": user["id"]}, {"$set": {"search_tokens": tokens}}))
+        if len(operations) >= 1000:
+            await db.users.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        await db.users.bulk_write(operations, ordered=False)
+
+async def run_periodically(interval: float, job, name: str):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except Exception:
+            logger.exception(f"Background job {name} failed")
+
+background_tasks: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def start_background_jobs():
+    counter_buffer.start()
+    media_store.start()
+    await event_hub.start()
+    if ADMIN_STATS_REFRESH_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(ADMIN_STATS_REFRESH_SECONDS, refresh_admin_stats, "refresh_admin_stats")
+        ))
+    # First loads start now so no request pays for them; later rebuilds stay off the request path
+    for index, interval, name in (
+        (connection_graph, GRAPH_REFRESH_SECONDS, "reload_connection_graph"),
+        (job_recommender, JOB_RECOMMENDER_REFRESH_SECONDS, "reload_job_recommender")
+    ):
+        background_tasks.append(asyncio.create_task(index.ensure_loaded()))
+        if interval > 0:
+            background_tasks.append(asyncio.create_task(run_periodically(interval, index.reload, name)))
+    if FEED_PULL_AUTHORS_REFRESH_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(FEED_PULL_AUTHORS_REFRESH_SECONDS, pull_authors.refresh, "refresh_pull_authors")
+        ))
+    if USER_STATS_RECONCILE_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(
+            run_periodically(USER_STATS_RECONCILE_SECONDS, reconcile_user_stats, "reconcile_user_stats")
+        ))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    for task in background_tasks:
+        task.cancel()
+    # Let in-flight fan-outs land before the client closes
+    await asyncio.gather(*fan_out_tasks, return_exceptions=True)
+    await counter_buffer.stop()
+    await event_hub.stop()
+    client.close()
+    password_hasher.shutdown()
+    media_store.shutdown()
\ No newline at end of file
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+LINKDEV Backend Benchmark Suite
+Seeds a local MongoDB (or mongomock-motor) and drives the ASGI app in-process
+with concurrent clients, emitting JSON results for comparison between commits
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).parent
+BENCHMARK_PASSWORD = "BenchPass123!"
+
+FIRST_NAMES = ["Ada", "Alan", "Grace", "Linus", "Margaret", "Dennis", "Barbara", "Ken", "Frances", "Guido"]
+LAST_NAMES = ["Lovelace", "Turing", "Hopper", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson", "Allen", "Rossum"]
+SKILLS = ["Python", "React", "MongoDB", "FastAPI", "Kubernetes", "AWS", "TypeScript", "Go", "SQL", "Docker", "Rust", "Java"]
+LOCATIONS = ["San Francisco", "New York", "London", "Berlin", "Bangalore", "Toronto", "Remote"]
+INDUSTRIES = ["Software", "Finance", "Healthcare", "Education", "Retail"]
+JOB_TITLES = ["Backend Engineer", "Frontend Developer", "Data Scientist", "DevOps Engineer", "Product Manager"]
+COMPANIES = ["Initech", "Globex", "Hooli", "Umbrella", "Stark Industries", "Wayne Enterprises"]
+JOB_TYPES = ["Full-time", "Part-time", "Contract", "Internship"]
+EXPERIENCE_LEVELS = ["Entry-level", "Mid-level", "Senior", "Lead"]
+SEARCH_QUERIES = ["python", "engineer", "react developer", "data", "devops kubernetes", "product"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the LINKDEV API in-process")
+    parser.add_argument("--mongomock", action="store_true", help="use mongomock-motor instead of a MongoDB server")
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db-name", default="linkdev_benchmark", help="database to drop and seed")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=10, help="accepted connections per user")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per scenario")
+    parser.add_argument("--scenarios", nargs="*", help="subset of scenarios to run")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    return parser.parse_args()
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class LinkdevBenchmark:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.backend = "mongomock" if args.mongomock else "mongodb"
+        self.users: List[Dict[str, Any]] = []
+        self.recruiters: List[Dict[str, Any]] = []
+        self.tokens: Dict[str, str] = {}
+
+        # server.py reads its Mongo settings at import time
+        os.environ["MONGO_URL"] = args.mongo_url
+        os.environ["DB_NAME"] = args.db_name
+        sys.path.insert(0, str(ROOT_DIR / "backend"))
+        import server
+
+        if args.mongomock:
+            from mongomock_motor import AsyncMongoMockClient
+
+            server.client = AsyncMongoMockClient()
+            server.db = server.client[args.db_name]
+        self.server = server
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def headers(self, user: Dict[str, Any]) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[user['id']]}"}
+
+    async def seed(self) -> Dict[str, float]:
+        """Drop the benchmark database and insert deterministic fixtures"""
+        server, db, rng, args = self.server, self.server.db, self.rng, self.args
+        started = time.perf_counter()
+        await server.client.drop_database(args.db_name)
+
+        now = datetime.utcnow()
+        password_hash = server.pwd_context.hash(BENCHMARK_PASSWORD)
+        for index in range(args.users):
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            skills = rng.sample(SKILLS, rng.randint(2, 6))
+            user = {
+                "id": self.new_id(),
+                "email": f"bench_{index}@linkdev.com",
+                "first_name": first_name,
+                "last_name": last_name,
+                "role": "recruiter" if index % 10 == 0 else "job_seeker",
+                "headline": f"{rng.choice(JOB_TITLES)} at {rng.choice(COMPANIES)}",
+                "summary": None,
+                "location": rng.choice(LOCATIONS),
+                "industry": rng.choice(INDUSTRIES),
+                "experience_years": rng.randint(0, 20),
+                "skills": skills,
+                "education": [],
+                "experience": [],
+                "profile_picture": None,
+                "connections_count": 0,
+                "created_at": now - timedelta(days=rng.randint(0, 365)),
+                "updated_at": now,
+                "password": password_hash,
+                "search_tokens": server.build_search_tokens(first_name, last_name, skills)
+            }
+            self.users.append(user)
+        self.recruiters = [user for user in self.users if user["role"] == "recruiter"]
+
+        pairs = set()
+        for user in self.users:
+            for peer in rng.sample(self.users, min(args.connections, len(self.users) - 1)):
+                if peer["id"] != user["id"]:
+                    pairs.add(tuple(sorted((user["id"], peer["id"]))))
+        connections = []
+        by_id = {user["id"]: user for user in self.users}
+        for sender_id, receiver_id in sorted(pairs):
+            created_at = now - timedelta(days=rng.randint(0, 180))
+            connections.append({
+                "id": self.new_id(),
+                "sender_id": sender_id,
+                "receiver_id": receiver_id,
+                "message": None,
+                "status": "accepted",
+                "created_at": created_at,
+                "updated_at": created_at
+            })
+            by_id[sender_id]["connections_count"] += 1
+            by_id[receiver_id]["connections_count"] += 1
+
+        jobs = []
+        for _ in range(args.jobs if self.recruiters else 0):
+            salary_min = rng.randrange(40000, 160000, 5000)
+            jobs.append({
+                "id": self.new_id(),
+                "title": rng.choice(JOB_TITLES),
+                "company": rng.choice(COMPANIES),
+                "description": " ".join(rng.sample(SKILLS, 4)) + " engineering role on a growing team",
+                "requirements": rng.sample(SKILLS, 3),
+                "location": rng.choice(LOCATIONS),
+                "job_type": rng.choice(JOB_TYPES),
+                "salary_min": salary_min,
+                "salary_max": salary_min + rng.randrange(10000, 60000, 5000),
+                "remote_allowed": rng.random() < 0.4,
+                "experience_level": rng.choice(EXPERIENCE_LEVELS),
+                "status": "active",
+                "posted_by": rng.choice(self.recruiters)["id"],
+                "posted_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 60)),
+                "applications_count": 0,
+                "views_count": 0
+            })
+
+        posts = []
+        for _ in range(args.posts):
+            posts.append({
+                "id": self.new_id(),
+                "author_id": rng.choice(self.users)["id"],
+                "content": f"Shipping {rng.choice(SKILLS)} improvements this week",
+                "image_url": None,
+                "likes_count": 0,
+                "comments_count": 0,
+                "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+            })
+
+        for collection, documents in (("users", self.users), ("connections", connections), ("jobs", jobs), ("posts", posts)):
+            for offset in range(0, len(documents), 1000):
+                await db[collection].insert_many([dict(document) for document in documents[offset:offset + 1000]])
+
+        if not args.mongomock:
+            await server.create_indexes()
+
+        self.tokens = {user["id"]: server.create_access_token(data={"sub": user["id"]}) for user in self.users}
+        return {
+            "seconds": round(time.perf_counter() - started, 3),
+            "users": len(self.users),
+            "connections": len(connections),
+            "jobs": len(jobs),
+            "posts": len(posts)
+        }
+
+    def scenarios(self) -> Dict[str, Callable]:
+        """Each scenario issues one request for a randomly chosen user"""
+        rng = self.rng
+
+        async def auth_login(client):
+            user = rng.choice(self.users)
+            return await client.post("/auth/login", json={"email": user["email"], "password": BENCHMARK_PASSWORD})
+
+        async def feed(client):
+            return await client.get("/posts/feed", params={"limit": 20}, headers=self.headers(rng.choice(self.users)))
+
+        async def job_search(client):
+            if self.args.mongomock:
+                # mongomock has no $text support, so fall back to the browse listing
+                return await client.get("/jobs", params={"limit": 20})
+            return await client.get("/jobs/search", params={"query": rng.choice(SEARCH_QUERIES), "limit": 20})
+
+        async def connections(client):
+            return await client.get("/connections", headers=self.headers(rng.choice(self.users)))
+
+        async def connection_suggestions(client):
+            return await client.get("/connections/suggestions", headers=self.headers(rng.choice(self.users)))
+
+        async def dashboard(client):
+            return await client.get("/dashboard/stats", headers=self.headers(rng.choice(self.users)))
+
+        return {
+            "auth_login": auth_login,
+            "feed": feed,
+            "job_search": job_search,
+            "connections": connections,
+            "connection_suggestions": connection_suggestions,
+            "dashboard": dashboard
+        }
+
+    async def run_scenario(self, client, request: Callable) -> Dict[str, Any]:
+        """Run warmup then measured requests across concurrent workers"""
+        for _ in range(self.args.warmup):
+            await request(client)
+
+        latencies: List[float] = []
+        status_counts: Dict[str, int] = {}
+        remaining = self.args.requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                response = await request(client)
+                latencies.append((time.perf_counter() - started) * 1000)
+                status_counts[str(response.status_code)] = status_counts.get(str(response.status_code), 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        samples = np.array(latencies)
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        return {
+            "requests": len(latencies),
+            "errors": sum(count for code, count in status_counts.items() if not code.startswith("2")),
+            "status_counts": status_counts,
+            "throughput_rps": round(len(latencies) / elapsed, 2),
+            "latency_ms": {
+                "mean": round(float(samples.mean()), 3),
+                "p50": round(float(p50), 3),
+                "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3),
+                "max": round(float(samples.max()), 3)
+            }
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        import httpx
+
+        seeded = await self.seed()
+        print(f"🌱 Seeded {seeded} on {self.backend}", file=sys.stderr)
+
+        scenarios = self.scenarios()
+        selected = self.args.scenarios or list(scenarios)
+        unknown = set(selected) - set(scenarios)
+        if unknown:
+            raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+        results = {}
+        transport = httpx.ASGITransport(app=self.server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark/api", timeout=60) as client:
+            for name in selected:
+                results[name] = await self.run_scenario(client, scenarios[name])
+                latency = results[name]["latency_ms"]
+                print(
+                    f"⏱️  {name}: {results[name]['throughput_rps']} req/s, "
+                    f"p50 {latency['p50']}ms, p95 {latency['p95']}ms, errors {results[name]['errors']}",
+                    file=sys.stderr
+                )
+
+        if not self.args.mongomock:
+            await self.server.client.drop_database(self.args.db_name)
+        await self.server.counter_buffer.stop()
+        self.server.password_hasher.shutdown()
+
+        return {
+            "revision": git_revision(),
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "backend": self.backend,
+            "config": {
+                key: getattr(self.args, key)
+                for key in ("users", "jobs", "posts", "connections", "concurrency", "requests", "warmup", "seed")
+            },
+            "seed": seeded,
+            "scenarios": results
+        }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """Percent change per scenario; positive latency deltas are regressions"""
+    def delta(current: float, previous: float) -> Optional[float]:
+        return round((current - previous) / previous * 100, 1) if previous else None
+
+    comparison = {}
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        comparison[name] = {
+            "throughput_rps_pct": delta(current["throughput_rps"], previous["throughput_rps"]),
+            **{
+                f"{quantile}_pct": delta(current["latency_ms"][quantile], previous["latency_ms"][quantile])
+                for quantile in ("p50", "p95", "p99")
+            }
+        }
+    return {"revision": baseline.get("revision"), "scenarios": comparison}
+
+
+def main():
+    args = parse_args()
+    results = asyncio.run(LinkdevBenchmark(args).run())
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            results["comparison"] = compare(results, json.load(baseline_file))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+        print(f"📄 Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
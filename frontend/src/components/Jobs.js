@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../App';
 import axios from 'axios';
 
@@ -29,23 +29,58 @@ const Jobs = () => {
     experience_level: 'Mid-level'
   });
 
+  const [nextCursor, setNextCursor] = useState(null);
+  const [nextSkip, setNextSkip] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadMoreRef = useRef(null);
+
   useEffect(() => {
     fetchJobs();
   }, [filters]);
 
-  const fetchJobs = async () => {
+  useEffect(() => {
+    const sentinel = loadMoreRef.current;
+    if (!sentinel || (!nextCursor && nextSkip === null) || loadingMore) return;
+
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) {
+        setLoadingMore(true);
+        fetchJobs(nextCursor, nextSkip);
+      }
+    });
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [nextCursor, nextSkip, loadingMore]);
+
+  const fetchJobs = async (cursor = null, skip = null) => {
     try {
       const params = new URLSearchParams();
       Object.entries(filters).forEach(([key, value]) => {
         if (value) params.append(key, value);
       });
-      
+
+      if (filters.query) {
+        // Keyword searches are ranked by relevance, so they page by offset
+        const offset = skip || 0;
+        params.append('skip', offset);
+        const response = await axios.get(`${API}/jobs/search?${params}`);
+        const { results, total } = response.data;
+        setJobs(prev => offset ? [...prev, ...results] : results);
+        setNextCursor(null);
+        setNextSkip(offset + results.length < total ? offset + results.length : null);
+        return;
+      }
+
+      if (cursor) params.append('cursor', cursor);
       const response = await axios.get(`${API}/jobs?${params}`);
-      setJobs(response.data);
+      setJobs(prev => cursor ? [...prev, ...response.data] : response.data);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+      setNextSkip(null);
     } catch (error) {
       console.error('Error fetching jobs:', error);
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -234,6 +269,11 @@ const Jobs = () => {
               <p className="mt-1 text-sm text-gray-500">Try adjusting your search filters.</p>
             </div>
           )}
+          {(nextCursor || nextSkip !== null) && (
+            <div ref={loadMoreRef} className="py-4 text-center text-sm text-gray-500">
+              {loadingMore ? 'Loading more jobs...' : ''}
+            </div>
+          )}
         </div>
       </div>
 
@@ -19,6 +19,53 @@ const Network = () => {
     fetchNetworkData();
   }, [activeTab]);
 
+  useEffect(() => {
+    // EventSource can't send headers, so each connection opens with a short-lived stream ticket
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+
+    const reconnect = () => {
+      if (!closed) retryTimer = setTimeout(connect, 5000);
+    };
+
+    const connect = async () => {
+      let ticket;
+      try {
+        const response = await axios.post(`${API}/events/ticket`);
+        ticket = response.data.ticket;
+      } catch (error) {
+        reconnect();
+        return;
+      }
+      if (closed) return;
+      source = new EventSource(`${API}/events/stream?ticket=${encodeURIComponent(ticket)}`);
+
+      source.addEventListener('connection_request', async () => {
+        const response = await axios.get(`${API}/connections/requests`);
+        setConnectionRequests(response.data);
+      });
+      source.addEventListener('connection_response', async (event) => {
+        const { data } = JSON.parse(event.data);
+        if (!data.accepted) return;
+        const response = await axios.get(`${API}/connections`);
+        setConnections(response.data);
+      });
+      // The browser's own retry would reuse the expired ticket, so reconnect with a fresh one
+      source.onerror = () => {
+        source.close();
+        reconnect();
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (source) source.close();
+    };
+  }, []);
+
   const fetchNetworkData = async () => {
     try {
       setLoading(true);
@@ -40,11 +87,17 @@ const Network = () => {
     }
   };
 
+  useEffect(() => {
+    if (searchQuery.trim().length < 2) return;
+    const timer = setTimeout(handleSearch, 250);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
   const handleSearch = async () => {
     if (!searchQuery.trim()) return;
     
     try {
-      const response = await axios.get(`${API}/users?query=${encodeURIComponent(searchQuery)}`);
+      const response = await axios.get(`${API}/users/typeahead?q=${encodeURIComponent(searchQuery)}`);
       setSearchResults(response.data.filter(u => u.id !== user.id));
       setActiveTab('search');
     } catch (error) {
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../App';
 import axios from 'axios';
 
@@ -15,19 +15,43 @@ const Posts = () => {
     image_url: ''
   });
   const [likedPosts, setLikedPosts] = useState(new Set());
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadMoreRef = useRef(null);
 
   useEffect(() => {
     fetchPosts();
   }, []);
 
-  const fetchPosts = async () => {
+  useEffect(() => {
+    const sentinel = loadMoreRef.current;
+    if (!sentinel || !nextCursor || loadingMore) return;
+
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) {
+        setLoadingMore(true);
+        fetchPosts(nextCursor);
+      }
+    });
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [nextCursor, loadingMore]);
+
+  const fetchPosts = async (cursor = null) => {
     try {
-      const response = await axios.get(`${API}/posts`);
-      setPosts(response.data);
+      const response = await axios.get(`${API}/posts/feed`, { params: cursor ? { cursor } : {} });
+      setPosts(prev => cursor ? [...prev, ...response.data] : response.data);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+      setLikedPosts(prev => {
+        const newSet = cursor ? new Set(prev) : new Set();
+        response.data.forEach(post => post.liked_by_me && newSet.add(post.id));
+        return newSet;
+      });
     } catch (error) {
       console.error('Error fetching posts:', error);
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -45,28 +69,26 @@ const Posts = () => {
 
   const likePost = async (postId) => {
     try {
-      await axios.post(`${API}/posts/${postId}/like`);
+      const response = await axios.post(`${API}/posts/${postId}/like`, null, {
+        params: { liked: !likedPosts.has(postId) }
+      });
+      const { liked, likes_count } = response.data;
       
       // Update local state
-      if (likedPosts.has(postId)) {
-        setLikedPosts(prev => {
-          const newSet = new Set(prev);
+      setLikedPosts(prev => {
+        const newSet = new Set(prev);
+        if (liked) {
+          newSet.add(postId);
+        } else {
           newSet.delete(postId);
-          return newSet;
-        });
-        setPosts(posts.map(post => 
-          post.id === postId 
-            ? { ...post, likes_count: post.likes_count - 1 }
-            : post
-        ));
-      } else {
-        setLikedPosts(prev => new Set(prev).add(postId));
-        setPosts(posts.map(post => 
-          post.id === postId 
-            ? { ...post, likes_count: post.likes_count + 1 }
-            : post
-        ));
-      }
+        }
+        return newSet;
+      });
+      setPosts(posts.map(post => 
+        post.id === postId 
+          ? { ...post, likes_count }
+          : post
+      ));
     } catch (error) {
       console.error('Error liking post:', error);
     }
@@ -152,10 +174,15 @@ const Posts = () => {
                 <div className="p-6 pb-4">
                   <div className="flex items-center space-x-3">
                     <div className="w-12 h-12 bg-gradient-to-r from-pink-500 to-purple-600 rounded-full flex items-center justify-center text-white font-bold">
-                      {getInitials('User', 'Name')} {/* You would get actual user data from post.author_id */}
+                      {getInitials(post.author?.first_name, post.author?.last_name)}
                     </div>
                     <div>
-                      <h3 className="font-semibold text-gray-900">Professional User</h3>
+                      <h3 className="font-semibold text-gray-900">
+                        {post.author ? `${post.author.first_name} ${post.author.last_name}` : 'Professional User'}
+                      </h3>
+                      {post.author?.headline && (
+                        <p className="text-sm text-gray-600">{post.author.headline}</p>
+                      )}
                       <p className="text-sm text-gray-500">{formatTimeAgo(post.created_at)}</p>
                     </div>
                   </div>
@@ -234,6 +261,11 @@ const Posts = () => {
               <p className="mt-1 text-sm text-gray-500">Be the first to share something with your network!</p>
             </div>
           )}
+          {nextCursor && (
+            <div ref={loadMoreRef} className="py-4 text-center text-sm text-gray-500">
+              {loadingMore ? 'Loading more posts...' : ''}
+            </div>
+          )}
         </div>
       </div>
 
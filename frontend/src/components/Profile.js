@@ -65,6 +65,19 @@ const Profile = () => {
     }
   };
 
+  const handlePictureUpload = async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+    const formData = new FormData();
+    formData.append('file', file);
+    try {
+      const response = await axios.post(`${API}/users/me/profile-picture`, formData);
+      setProfile({ ...profile, profile_picture: response.data.profile_picture });
+    } catch (error) {
+      alert(error.response?.data?.detail || 'Failed to upload profile picture');
+    }
+  };
+
   const handleEditSubmit = async (e) => {
     e.preventDefault();
     try {
@@ -156,9 +169,21 @@ const Profile = () => {
               <div className="relative px-6 pb-6">
                 <div className="flex items-center space-x-6">
                   <div className="relative -mt-16">
-                    <div className="w-32 h-32 bg-white rounded-full flex items-center justify-center text-3xl font-bold text-pink-500 border-4 border-white shadow-lg">
-                      {getInitials(profile?.first_name, profile?.last_name)}
-                    </div>
+                    {profile?.profile_picture ? (
+                      <img
+                        src={`${BACKEND_URL}${profile.profile_picture}`}
+                        alt={`${profile.first_name} ${profile.last_name}`}
+                        className="w-32 h-32 rounded-full object-cover border-4 border-white shadow-lg"
+                      />
+                    ) : (
+                      <div className="w-32 h-32 bg-white rounded-full flex items-center justify-center text-3xl font-bold text-pink-500 border-4 border-white shadow-lg">
+                        {getInitials(profile?.first_name, profile?.last_name)}
+                      </div>
+                    )}
+                    <label className="absolute bottom-0 right-0 bg-pink-500 text-white text-xs px-2 py-1 rounded-full cursor-pointer hover:bg-pink-600">
+                      Edit
+                      <input type="file" accept="image/jpeg,image/png,image/gif,image/webp" className="hidden" onChange={handlePictureUpload} />
+                    </label>
                   </div>
                   <div className="flex-1 pt-4">
                     <div className="flex justify-between items-start">
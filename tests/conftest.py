@@ -0,0 +1,29 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "linkdev_test")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import server  # noqa: E402
+
+
+@pytest.fixture
+def db(monkeypatch):
+    # Fresh in-memory database and fresh process-local state for every test
+    client = AsyncMongoMockClient()
+    database = client[os.environ["DB_NAME"]]
+    monkeypatch.setattr(server, "client", client)
+    monkeypatch.setattr(server, "db", database)
+    monkeypatch.setattr(server, "counter_buffer", server.CounterBuffer(60, 1000))
+    monkeypatch.setattr(server, "connection_graph", server.ConnectionGraph())
+    monkeypatch.setattr(server, "job_recommender", server.JobRecommender())
+    monkeypatch.setattr(server, "pull_authors", server.PullAuthors())
+    monkeypatch.setattr(server, "user_cache", server.TTLCache(100, 60))
+    monkeypatch.setattr(server, "author_card_cache", server.TTLCache(100, 60))
+    server.admin_stats_history.clear()
+    return database
@@ -0,0 +1,42 @@
+import asyncio
+
+import httpx
+
+import server
+
+
+def api_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://test/api")
+
+
+async def register(api: httpx.AsyncClient, email: str, role: str = "job_seeker", first_name: str = "Test",
+                   last_name: str = "User", **fields):
+    response = await api.post("/auth/register", json={
+        "email": email, "password": "secret123", "first_name": first_name, "last_name": last_name,
+        "role": role, **fields
+    })
+    assert response.status_code == 200, response.text
+    body = response.json()
+    return {"Authorization": f"Bearer {body['access_token']}"}, body["user"]["id"]
+
+
+async def connect(api: httpx.AsyncClient, sender: dict, receiver: dict, receiver_id: str):
+    response = await api.post("/connections/request", params={"receiver_id": receiver_id}, headers=sender)
+    assert response.status_code == 200, response.text
+    request = (await api.get("/connections/requests", headers=receiver)).json()[-1]
+    response = await api.put(f"/connections/{request['id']}/respond", params={"accept": "true"}, headers=receiver)
+    assert response.status_code == 200, response.text
+
+
+async def drain_fan_out():
+    await asyncio.gather(*server.fan_out_tasks)
+
+
+async def post_job(api: httpx.AsyncClient, headers: dict, **fields) -> dict:
+    job = {
+        "title": "Backend Engineer", "company": "Acme", "description": "Build APIs",
+        "requirements": ["Python"], "location": "Remote", **fields
+    }
+    response = await api.post("/jobs", json=job, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
@@ -0,0 +1,33 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, register
+
+
+def test_admin_stats_are_served_from_snapshots(db):
+    async def scenario():
+        async with api_client() as api:
+            admin, _ = await register(api, "admin@example.com", role="admin")
+            seeker, _ = await register(api, "seeker@example.com")
+            assert (await api.get("/admin/stats", headers=seeker)).status_code == 403
+
+            first = (await api.get("/admin/stats", headers=admin)).json()
+            assert first["total_users"] == 2 and first["exact"] is False
+            assert len(server.admin_stats_history) == 1
+
+            # New users show up only in fresh reads until the next refresh
+            await register(api, "late@example.com")
+            assert (await api.get("/admin/stats", headers=admin)).json() == first
+            fresh = (await api.get("/admin/stats", params={"fresh": "true"}, headers=admin)).json()
+            assert fresh["total_users"] == 3 and fresh["exact"] is True
+
+            await server.refresh_admin_stats()
+            assert (await api.get("/admin/stats", headers=admin)).json()["total_users"] == 3
+
+            history = (await api.get("/admin/stats/history", params={"limit": 1}, headers=admin)).json()
+            assert history["refresh_interval_seconds"] == server.ADMIN_STATS_REFRESH_SECONDS
+            assert [snapshot["total_users"] for snapshot in history["snapshots"]] == [3]
+            history = (await api.get("/admin/stats/history", headers=admin)).json()
+            assert [snapshot["total_users"] for snapshot in history["snapshots"]] == [2, 3]
+
+    asyncio.run(scenario())
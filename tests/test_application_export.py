@@ -0,0 +1,49 @@
+import asyncio
+import csv
+import io
+import json
+
+import server
+from tests.helpers import api_client, post_job, register
+
+
+def test_applications_page_and_export(db, monkeypatch):
+    monkeypatch.setattr(server, "APPLICATION_EXPORT_BATCH_SIZE", 2)
+
+    async def scenario():
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            other, _ = await register(api, "other@example.com", role="recruiter")
+            job = await post_job(api, recruiter)
+            for index in range(5):
+                seeker, _ = await register(api, f"seeker{index}@example.com", first_name=f"Seeker{index}")
+                await api.post(
+                    f"/jobs/{job['id']}/apply", params={"cover_letter": f"hi, {index}"}, headers=seeker
+                )
+                # Distinct applied_at values at Mongo's millisecond precision
+                await asyncio.sleep(0.002)
+
+            url = f"/jobs/{job['id']}/applications"
+            first = await api.get(url, params={"limit": 3}, headers=recruiter)
+            second = await api.get(url, params={"limit": 3, "cursor": first.headers["x-next-cursor"]}, headers=recruiter)
+            cover_letters = [application["cover_letter"] for application in first.json() + second.json()]
+            assert cover_letters == [f"hi, {index}" for index in reversed(range(5))]
+            assert "x-next-cursor" not in second.headers
+            assert (await api.get(url, params={"limit": 1000}, headers=recruiter)).status_code == 422
+            assert (await api.get(url, headers=other)).status_code == 403
+
+            export = await api.get(f"{url}/export", headers=recruiter)
+            assert export.headers["content-type"] == "application/x-ndjson"
+            rows = [json.loads(line) for line in export.text.splitlines()]
+            assert [row["applicant_name"] for row in rows] == [f"Seeker{index} User" for index in reversed(range(5))]
+            assert list(rows[0]) == server.APPLICATION_EXPORT_FIELDS
+
+            export = await api.get(f"{url}/export", params={"format": "csv"}, headers=recruiter)
+            assert export.headers["content-disposition"] == f'attachment; filename="applications-{job["id"]}.csv"'
+            rows = list(csv.DictReader(io.StringIO(export.text)))
+            assert [row["cover_letter"] for row in rows] == cover_letters
+
+            assert (await api.get(f"{url}/export", params={"format": "xml"}, headers=recruiter)).status_code == 400
+            assert (await api.get(f"{url}/export", headers=other)).status_code == 403
+
+    asyncio.run(scenario())
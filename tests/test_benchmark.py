@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import backend_benchmark
+
+ROOT_DIR = Path(__file__).parent.parent
+
+
+def scenario(rps: float, p50: float, p95: float, p99: float) -> dict:
+    return {"throughput_rps": rps, "latency_ms": {"p50": p50, "p95": p95, "p99": p99}}
+
+
+def test_compare_reports_percent_change_per_scenario():
+    results = {"scenarios": {"feed": scenario(120, 5, 10, 20), "dashboard": scenario(50, 1, 2, 3)}}
+    baseline = {"revision": "abc123", "scenarios": {"feed": scenario(100, 10, 10, 0)}}
+    assert backend_benchmark.compare(results, baseline) == {
+        "revision": "abc123",
+        "scenarios": {"feed": {"throughput_rps_pct": 20.0, "p50_pct": -50.0, "p95_pct": 0.0, "p99_pct": None}}
+    }
+
+
+def test_small_mongomock_run_writes_comparable_results(tmp_path):
+    output = tmp_path / "results.json"
+    command = [
+        sys.executable, "backend_benchmark.py", "--mongomock", "--users", "6", "--jobs", "5", "--posts", "10",
+        "--connections", "2", "--requests", "4", "--warmup", "1", "--concurrency", "2", "--output", str(output)
+    ]
+    subprocess.run(command, cwd=ROOT_DIR, check=True, capture_output=True, timeout=120)
+    results = json.loads(output.read_text())
+    assert results["seed"]["users"] == 6 and results["seed"]["posts"] == 10
+    assert results["scenarios"]
+    assert all(result["errors"] == 0 for result in results["scenarios"].values())
+
+    subprocess.run(command + ["--baseline", str(output)], cwd=ROOT_DIR, check=True, capture_output=True, timeout=120)
+    assert set(json.loads(output.read_text())["comparison"]["scenarios"]) == set(results["scenarios"])
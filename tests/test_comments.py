@@ -0,0 +1,50 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, register
+
+
+def test_comment_threads_and_feed_preview(db, monkeypatch):
+    monkeypatch.setattr(server, "FEED_COMMENT_PREVIEW_SIZE", 3)
+
+    async def scenario():
+        async with api_client() as api:
+            headers, _ = await register(api, "commenter@example.com")
+            post = (await api.post("/posts", json={"content": "hello"}, headers=headers)).json()
+            for index in range(5):
+                response = await api.post(
+                    f"/posts/{post['id']}/comments", json={"content": f"c{index}"}, headers=headers
+                )
+                assert response.status_code == 200
+                # Distinct created_at values at Mongo's millisecond precision
+                await asyncio.sleep(0.002)
+
+            pages, cursor = [], None
+            while True:
+                params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+                response = await api.get(f"/posts/{post['id']}/comments", params=params, headers=headers)
+                pages.append([comment["content"] for comment in response.json()])
+                cursor = response.headers.get("x-next-cursor")
+                if cursor is None:
+                    break
+            assert pages == [["c4", "c3"], ["c2", "c1"], ["c0"]]
+
+            stored = await db.posts.find_one({"id": post["id"]})
+            assert stored["comments_count"] == 5
+            assert [comment["content"] for comment in stored["recent_comments"]] == ["c2", "c3", "c4"]
+
+            too_many = await api.get(f"/posts/{post['id']}/comments", params={"limit": 500}, headers=headers)
+            assert too_many.status_code == 422
+
+    asyncio.run(scenario())
+
+
+def test_comment_on_a_missing_post_is_rolled_back(db):
+    async def scenario():
+        async with api_client() as api:
+            headers, _ = await register(api, "commenter@example.com")
+            response = await api.post("/posts/missing/comments", json={"content": "hi"}, headers=headers)
+            assert response.status_code == 404
+            assert await db.comments.count_documents({}) == 0
+
+    asyncio.run(scenario())
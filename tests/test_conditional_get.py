@@ -0,0 +1,64 @@
+import asyncio
+
+from tests.helpers import api_client, connect, post_job, register
+
+FAR_FUTURE = "Fri, 01 Jan 2100 00:00:00 GMT"
+
+
+def test_profile_etag_tracks_connection_count(db):
+    async def scenario():
+        async with api_client() as api:
+            viewer, viewer_id = await register(api, "viewer@example.com")
+            subject, subject_id = await register(api, "subject@example.com")
+            url = f"/users/{subject_id}"
+            first = await api.get(url, headers=viewer)
+            assert first.status_code == 200 and first.headers["etag"].startswith('W/"')
+            assert "last-modified" not in first.headers
+
+            cached = await api.get(url, headers={**viewer, "If-None-Match": first.headers["etag"]})
+            assert cached.status_code == 304 and cached.content == b""
+            # A date-only revalidation can't prove counters unchanged, so the body is always sent
+            dated = await api.get(url, headers={**viewer, "If-Modified-Since": FAR_FUTURE})
+            assert dated.status_code == 200
+
+            await connect(api, viewer, subject, subject_id)
+            changed = await api.get(url, headers={**viewer, "If-None-Match": first.headers["etag"]})
+            assert changed.status_code == 200 and changed.json()["connections_count"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_job_etag_ignores_views_but_not_applications(db):
+    async def scenario():
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            seeker, _ = await register(api, "seeker@example.com")
+            job = await post_job(api, recruiter)
+            url = f"/jobs/{job['id']}"
+            first = await api.get(url)
+            assert first.headers["cache-control"].startswith("public")
+            assert "last-modified" not in first.headers
+            etag = first.headers["etag"]
+            assert (await api.get(url, headers={"If-None-Match": etag})).status_code == 304
+            assert (await api.get(url, headers={"If-None-Match": f'"other", {etag[2:]}'})).status_code == 304
+
+            await api.post(f"/jobs/{job['id']}/apply", headers=seeker)
+            assert (await api.get(url, headers={"If-None-Match": etag})).status_code == 200
+            assert (await api.get(url, headers={"If-Modified-Since": FAR_FUTURE})).status_code == 200
+
+    asyncio.run(scenario())
+
+
+def test_listings_answer_304(db):
+    async def scenario():
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            await post_job(api, recruiter)
+            await api.post("/posts", json={"content": "hello"}, headers=recruiter)
+            for path, headers in (("/jobs", {}), ("/posts", recruiter)):
+                first = await api.get(path, headers=headers)
+                cached = await api.get(path, headers={**headers, "If-None-Match": first.headers["etag"]})
+                assert cached.status_code == 304
+                assert cached.headers["etag"] == first.headers["etag"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,68 @@
+import asyncio
+
+import server
+from server import ConnectionGraph
+from tests.helpers import api_client, connect, register
+
+
+def test_suggestions_rank_by_mutual_connections():
+    graph = ConnectionGraph()
+    for a, b in [("me", "ann"), ("me", "bob"), ("ann", "cat"), ("bob", "cat"), ("ann", "dan"), ("bob", "me")]:
+        graph.add_edge(a, b)
+
+    assert graph.suggestions("me", 10, set()) == [("cat", 2), ("dan", 1)]
+    assert graph.suggestions("me", 1, set()) == [("cat", 2)]
+    assert graph.suggestions("me", 10, {"cat"}) == [("dan", 1)]
+    assert graph.suggestions("nobody", 10, set()) == []
+    assert graph.mutual_count("me", "cat") == 2
+    assert graph.stats()["edges"] == 5
+    assert graph.connected("me", "ann") and graph.connected("ann", "me")
+    assert not graph.connected("me", "cat") and not graph.connected("me", "nobody")
+
+
+def test_edges_added_during_a_reload_survive_the_swap(db):
+    async def scenario():
+        await db.connections.insert_one({"sender_id": "a", "receiver_id": "b", "status": "accepted"})
+        graph = ConnectionGraph()
+        build = graph._build
+
+        async def slow_build():
+            fresh = await build()
+            # An accept lands while the rebuild is still reading its cursor
+            graph.add_edge("a", "c")
+            return fresh
+
+        graph._build = slow_build
+        await graph.reload()
+        assert graph.connected("a", "b") and graph.connected("a", "c")
+        assert graph.age_seconds() is not None
+
+    asyncio.run(scenario())
+
+
+def test_suggestion_and_mutual_endpoints(db):
+    async def scenario():
+        async with api_client() as api:
+            me, me_id = await register(api, "me@example.com")
+            ann, ann_id = await register(api, "ann@example.com")
+            bob, bob_id = await register(api, "bob@example.com")
+            cat, cat_id = await register(api, "cat@example.com")
+            dan, dan_id = await register(api, "dan@example.com")
+            await connect(api, me, ann, ann_id)
+            await connect(api, me, bob, bob_id)
+            await connect(api, ann, cat, cat_id)
+            await connect(api, bob, cat, cat_id)
+            await connect(api, ann, dan, dan_id)
+            await server.connection_graph.reload()
+
+            suggestions = (await api.get("/connections/suggestions", headers=me)).json()
+            assert [(item["id"], item["mutual_connections"]) for item in suggestions] == [(cat_id, 2), (dan_id, 1)]
+            mutual = await api.get("/connections/mutual", params={"user_ids": [cat_id, dan_id]}, headers=me)
+            assert mutual.json() == {cat_id: 2, dan_id: 1}
+
+            # A pending request is not suggested again
+            await api.post("/connections/request", params={"receiver_id": cat_id}, headers=me)
+            suggestions = (await api.get("/connections/suggestions", headers=me)).json()
+            assert [item["id"] for item in suggestions] == [dan_id]
+
+    asyncio.run(scenario())
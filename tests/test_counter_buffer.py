@@ -0,0 +1,102 @@
+import asyncio
+
+import server
+
+
+def test_overlay_includes_pending_deltas():
+    buffer = server.CounterBuffer(60, 1000)
+    buffer.incr("posts", "p1", "likes_count")
+    buffer.incr("posts", "p1", "likes_count")
+    buffer.incr("posts", "p1", "comments_count", -1)
+    assert buffer.overlay("posts", {"id": "p1", "likes_count": 3}) == {
+        "id": "p1", "likes_count": 5, "comments_count": -1
+    }
+    assert buffer.overlay("posts", {"id": "p2", "likes_count": 3}) == {"id": "p2", "likes_count": 3}
+    assert buffer.pending("posts", "p1", "likes_count") == 2
+
+
+def test_flush_writes_deltas_once(db):
+    async def scenario():
+        await db.posts.insert_many([{"id": "p1", "likes_count": 1}, {"id": "p2", "likes_count": 0}])
+        await db.jobs.insert_one({"id": "j1", "applications_count": 0})
+        buffer = server.CounterBuffer(60, 1000)
+        buffer.incr("posts", "p1", "likes_count", 2)
+        buffer.incr("posts", "p2", "likes_count")
+        buffer.incr("jobs", "j1", "applications_count")
+        await buffer.flush()
+
+        stored = {post["id"]: post["likes_count"] for post in await db.posts.find().to_list(None)}
+        assert stored == {"p1": 3, "p2": 1}
+        assert (await db.jobs.find_one({"id": "j1"}))["applications_count"] == 1
+        # Nothing is left to overlay once the write landed
+        assert buffer.overlay("posts", {"id": "p1", "likes_count": 3})["likes_count"] == 3
+        assert buffer.stats()["pending_documents"] == 0
+        assert buffer.flushed_documents == 3
+
+    asyncio.run(scenario())
+
+
+def test_failed_flush_is_requeued(db, monkeypatch):
+    async def scenario():
+        await db.posts.insert_one({"id": "p1", "likes_count": 0})
+        buffer = server.CounterBuffer(60, 1000)
+        buffer.incr("posts", "p1", "likes_count", 4)
+
+        collection_type = type(db.posts)
+        bulk_write = collection_type.bulk_write
+
+        async def failing_bulk_write(self, *args, **kwargs):
+            raise ConnectionError("primary stepped down")
+
+        monkeypatch.setattr(collection_type, "bulk_write", failing_bulk_write)
+        await buffer.flush()
+        assert buffer.failures == 1
+        assert buffer.overlay("posts", {"id": "p1", "likes_count": 0})["likes_count"] == 4
+
+        monkeypatch.setattr(collection_type, "bulk_write", bulk_write)
+        await buffer.flush()
+        assert (await db.posts.find_one({"id": "p1"}))["likes_count"] == 4
+        assert buffer.overlay("posts", {"id": "p1", "likes_count": 4})["likes_count"] == 4
+
+    asyncio.run(scenario())
+
+
+def test_stop_keeps_deltas_from_an_interrupted_flush(db, monkeypatch):
+    async def scenario():
+        await db.posts.insert_one({"id": "p1", "likes_count": 0})
+        buffer = server.CounterBuffer(0.01, 1000)
+        collection_type = type(db.posts)
+        bulk_write = collection_type.bulk_write
+        started = asyncio.Event()
+
+        async def stalled_bulk_write(self, *args, **kwargs):
+            if not started.is_set():
+                started.set()
+                # Never returns; shutdown has to cancel the periodic flush mid-write
+                await asyncio.Event().wait()
+            return await bulk_write(self, *args, **kwargs)
+
+        monkeypatch.setattr(collection_type, "bulk_write", stalled_bulk_write)
+        buffer.start()
+        buffer.incr("posts", "p1", "likes_count", 2)
+        await started.wait()
+        buffer.incr("posts", "p1", "likes_count", 3)
+
+        await buffer.stop()
+        assert (await db.posts.find_one({"id": "p1"}))["likes_count"] == 5
+        assert buffer.stats()["pending_documents"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_size_triggered_flush(db):
+    async def scenario():
+        await db.posts.insert_many([{"id": f"p{index}", "views_count": 0} for index in range(3)])
+        buffer = server.CounterBuffer(60, 3)
+        for index in range(3):
+            buffer.incr("posts", f"p{index}", "views_count")
+        await buffer.stop()
+        assert await db.posts.count_documents({"views_count": 1}) == 3
+        assert buffer.flushes == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,43 @@
+import asyncio
+
+from tests.helpers import api_client, connect, drain_fan_out, register
+
+
+def test_feed_hydrates_authors_and_likes_in_batches(db, monkeypatch):
+    async def scenario():
+        async with api_client() as api:
+            reader, reader_id = await register(api, "reader@example.com")
+            authors = []
+            for index in range(3):
+                headers, author_id = await register(api, f"author{index}@example.com", first_name=f"Author{index}")
+                await connect(api, headers, reader, reader_id)
+                authors.append((headers, author_id))
+
+            post_ids = []
+            for headers, _ in authors * 2:
+                post_ids.append((await api.post("/posts", json={"content": "update"}, headers=headers)).json()["id"])
+                await asyncio.sleep(0.002)
+            await drain_fan_out()
+            await api.post(f"/posts/{post_ids[0]}/like", headers=reader)
+
+            queries = []
+            collection_type = type(db.users)
+            find = collection_type.find
+
+            def counting_find(self, *args, **kwargs):
+                queries.append(self.name)
+                return find(self, *args, **kwargs)
+
+            monkeypatch.setattr(collection_type, "find", counting_find)
+            feed = (await api.get("/posts/feed", headers=reader)).json()
+            assert [post["id"] for post in feed] == post_ids[::-1]
+            assert {post["author"]["first_name"] for post in feed} == {"Author0", "Author1", "Author2"}
+            assert "email" not in feed[0]["author"]
+            assert [post["liked_by_me"] for post in feed] == [False] * 5 + [True]
+            assert queries.count("users") == 1 and queries.count("post_likes") == 1
+
+            # Author cards come from the cache on the next page load
+            await api.get("/posts/feed", headers=reader)
+            assert queries.count("users") == 1
+
+    asyncio.run(scenario())
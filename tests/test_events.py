@@ -0,0 +1,121 @@
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+import server
+from tests.helpers import api_client, connect, register
+
+
+class FakeRequest:
+    # Stands in for the Starlette request; tests flip disconnected to end the stream
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def test_hub_delivers_to_subscribers_and_drops_on_overflow():
+    async def scenario():
+        hub = server.InMemoryEventHub(queue_size=2)
+        first, second = hub.subscribe("u1"), hub.subscribe("u1")
+        other = hub.subscribe("u2")
+        await hub.publish(["u1"], "ping", {"n": 1})
+        assert first.get_nowait()["data"] == {"n": 1}
+        assert second.get_nowait()["type"] == "ping"
+        assert other.empty()
+
+        for n in range(3):
+            await hub.publish(["u2"], "ping", {"n": n})
+        assert hub.dropped == 1 and other.qsize() == 2
+
+        hub.unsubscribe("u1", first)
+        hub.unsubscribe("u1", second)
+        hub.unsubscribe("u2", other)
+        assert hub.stats()["subscribed_users"] == 0 and hub.stats()["published"] == 4
+
+    asyncio.run(scenario())
+
+
+def test_stream_sends_events_and_keepalives(monkeypatch):
+    hub = server.InMemoryEventHub(10)
+    monkeypatch.setattr(server, "event_hub", hub)
+    monkeypatch.setattr(server, "EVENT_HEARTBEAT_SECONDS", 0.01)
+
+    async def scenario():
+        request = FakeRequest()
+        stream = server.stream_events(request, "u1")
+        assert await anext(stream) == "retry: 5000\n\n"
+        await hub.publish(["u1"], "post_liked", {"post_id": "p1"})
+        frame = await anext(stream)
+        event_id = json.loads(frame.split("data: ", 1)[1])["id"]
+        assert frame.startswith(f"id: {event_id}\nevent: post_liked\n")
+        assert await anext(stream) == ": keepalive\n\n"
+
+        request.disconnected = True
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+        assert hub.stats()["subscriptions"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_accepts_only_fresh_event_tickets(db):
+    async def scenario():
+        async with api_client() as api:
+            headers, user_id = await register(api, "viewer@example.com")
+            access_token = headers["Authorization"].removeprefix("Bearer ")
+            assert (await api.post("/events/ticket")).status_code in (401, 403)
+            body = (await api.post("/events/ticket", headers=headers)).json()
+            assert body["expires_in"] == server.EVENT_TICKET_TTL_SECONDS
+
+            # The long-lived API token is not a ticket, and a ticket is not an API token
+            for ticket in (access_token, "garbage"):
+                assert (await api.get("/events/stream", params={"ticket": ticket})).status_code == 401
+            assert (await api.get("/events/stream")).status_code == 422
+            ticket_as_bearer = {"Authorization": f"Bearer {body['ticket']}"}
+            assert (await api.get("/users/me", headers=ticket_as_bearer)).status_code == 401
+
+            expired = server.create_access_token(
+                {"sub": user_id, "aud": server.EVENT_TICKET_AUDIENCE}, timedelta(seconds=-1)
+            )
+            assert (await api.get("/events/stream", params={"ticket": expired})).status_code == 401
+
+            response = await server.get_event_stream(FakeRequest(), body["ticket"])
+            assert response.media_type == "text/event-stream"
+            assert response.headers["cache-control"] == "no-cache"
+
+        with pytest.raises(HTTPException):
+            unknown = server.create_access_token({"sub": "deleted", "aud": server.EVENT_TICKET_AUDIENCE})
+            await server.get_event_stream(FakeRequest(), unknown)
+
+    asyncio.run(scenario())
+
+
+def test_actions_publish_events(db, monkeypatch):
+    hub = server.InMemoryEventHub(10)
+    monkeypatch.setattr(server, "event_hub", hub)
+
+    async def scenario():
+        async with api_client() as api:
+            author, author_id = await register(api, "author@example.com")
+            fan, fan_id = await register(api, "fan@example.com")
+            inbox = hub.subscribe(author_id)
+            fan_inbox = hub.subscribe(fan_id)
+
+            await connect(api, fan, author, author_id)
+            assert inbox.get_nowait()["type"] == "connection_request"
+            assert fan_inbox.get_nowait()["data"]["accepted"] is True
+
+            post = (await api.post("/posts", json={"content": "hello"}, headers=author)).json()
+            await api.post(f"/posts/{post['id']}/like", headers=fan)
+            liked = inbox.get_nowait()
+            assert liked["type"] == "post_liked" and liked["data"]["likes_count"] == 1
+            # Liking your own post doesn't notify you
+            await api.post(f"/posts/{post['id']}/like", headers=author)
+            assert inbox.empty()
+
+    asyncio.run(scenario())
@@ -0,0 +1,78 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, connect, drain_fan_out, register
+
+
+def test_posts_fan_out_to_connections_only(db):
+    async def scenario():
+        async with api_client() as api:
+            author, author_id = await register(api, "author@example.com")
+            friend, friend_id = await register(api, "friend@example.com")
+            stranger, _ = await register(api, "stranger@example.com")
+            await connect(api, author, friend, friend_id)
+
+            post = (await api.post("/posts", json={"content": "hello network"}, headers=author)).json()
+            # The author's own entry is written before the response, the rest in the background
+            own = await db.timelines.find_one({"user_id": author_id})
+            assert [entry["post_id"] for entry in own["entries"]] == [post["id"]]
+            await drain_fan_out()
+
+            timeline = await db.timelines.find_one({"user_id": friend_id})
+            assert post["id"] in [entry["post_id"] for entry in timeline["entries"]]
+            feed = (await api.get("/posts/feed", headers=friend)).json()
+            assert [item["id"] for item in feed] == [post["id"]]
+            assert feed[0]["author"]["id"] == author_id
+            assert (await api.get("/posts/feed", headers=stranger)).json() == []
+
+    asyncio.run(scenario())
+
+
+def test_accepting_a_connection_rebuilds_both_timelines(db):
+    async def scenario():
+        async with api_client() as api:
+            author, author_id = await register(api, "author@example.com")
+            reader, reader_id = await register(api, "reader@example.com")
+            older = (await api.post("/posts", json={"content": "before we met"}, headers=author)).json()
+            await drain_fan_out()
+            assert (await api.get("/posts/feed", headers=reader)).json() == []
+
+            await connect(api, reader, author, author_id)
+            assert (await db.timelines.find_one({"user_id": reader_id}))["built"] is False
+            feed = (await api.get("/posts/feed", headers=reader)).json()
+            assert [item["id"] for item in feed] == [older["id"]]
+
+    asyncio.run(scenario())
+
+
+def test_well_connected_authors_are_pulled_on_read(db, monkeypatch):
+    monkeypatch.setattr(server, "FEED_FANOUT_MAX_CONNECTIONS", 0)
+
+    async def scenario():
+        async with api_client() as api:
+            author, author_id = await register(api, "celebrity@example.com")
+            fan, fan_id = await register(api, "fan@example.com")
+            stranger, _ = await register(api, "stranger@example.com")
+            await connect(api, author, fan, fan_id)
+            await server.connection_graph.ensure_loaded()
+            await api.get("/posts/feed", headers=fan)
+
+            posts = []
+            for index in range(3):
+                posts.append((await api.post("/posts", json={"content": f"post {index}"}, headers=author)).json())
+                await drain_fan_out()
+                # Keeps created_at distinct at Mongo's millisecond precision
+                await asyncio.sleep(0.002)
+
+            assert server.pull_authors.ids == {author_id}
+            timeline = await db.timelines.find_one({"user_id": fan_id})
+            assert not any(entry["post_id"] in {post["id"] for post in posts} for entry in timeline["entries"])
+
+            first = await api.get("/posts/feed", params={"limit": 2}, headers=fan)
+            second = await api.get(
+                "/posts/feed", params={"limit": 2, "cursor": first.headers["x-next-cursor"]}, headers=fan
+            )
+            assert [item["id"] for item in first.json() + second.json()] == [post["id"] for post in reversed(posts)]
+            assert (await api.get("/posts/feed", headers=stranger)).json() == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,60 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, post_job, register
+
+
+def hide_from_precheck(monkeypatch, db, collection: str, fields: set):
+    # Makes the find_one pre-check miss, as if a concurrent request inserted in between
+    collection_type = type(db[collection])
+    find_one = collection_type.find_one
+
+    async def racing_find_one(self, filter=None, *args, **kwargs):
+        if self.name == collection and isinstance(filter, dict) and set(filter) == fields:
+            return None
+        return await find_one(self, filter, *args, **kwargs)
+
+    monkeypatch.setattr(collection_type, "find_one", racing_find_one)
+
+
+def test_unique_indexes_are_provisioned(db):
+    asyncio.run(server.create_indexes())
+    users = asyncio.run(db.users.index_information())
+    applications = asyncio.run(db.applications.index_information())
+    assert users["email_unique"]["unique"]
+    assert applications["job_applicant_unique"]["unique"]
+
+
+def test_register_race_maps_to_400(db, monkeypatch):
+    async def scenario():
+        await server.create_indexes()
+        async with api_client() as api:
+            await register(api, "taken@example.com")
+            hide_from_precheck(monkeypatch, db, "users", {"email"})
+            response = await api.post("/auth/register", json={
+                "email": "taken@example.com", "password": "secret123",
+                "first_name": "Second", "last_name": "Try", "role": "job_seeker"
+            })
+            assert response.status_code == 400
+            assert response.json()["detail"] == "Email already registered"
+            assert await db.users.count_documents({"email": "taken@example.com"}) == 1
+
+    asyncio.run(scenario())
+
+
+def test_apply_race_maps_to_400(db, monkeypatch):
+    async def scenario():
+        await server.create_indexes()
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            seeker, _ = await register(api, "seeker@example.com")
+            job = await post_job(api, recruiter)
+            assert (await api.post(f"/jobs/{job['id']}/apply", headers=seeker)).status_code == 200
+
+            hide_from_precheck(monkeypatch, db, "applications", {"job_id", "applicant_id"})
+            response = await api.post(f"/jobs/{job['id']}/apply", headers=seeker)
+            assert response.status_code == 400
+            assert response.json()["detail"] == "Already applied to this job"
+            assert await db.applications.count_documents({"job_id": job["id"]}) == 1
+
+    asyncio.run(scenario())
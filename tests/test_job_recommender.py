@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from server import JobRecommender, ReloadableIndex, skill_terms
+from tests.helpers import api_client, post_job, register
+
+
+def test_skill_terms_keep_tech_punctuation():
+    assert skill_terms(["3 years of C++", "Node.js and C#", "Strong SQL skills."]) == ["c#", "c++", "node.js", "sql"]
+
+
+def test_recommend_scores_by_shared_rare_terms():
+    recommender = JobRecommender()
+    recommender.add_job("backend", ["Python", "FastAPI", "MongoDB"])
+    recommender.add_job("data", ["Python", "Pandas"])
+    recommender.add_job("frontend", ["React", "TypeScript"])
+    recommender.add_job("backend", ["ignored duplicate"])
+
+    results = recommender.recommend(["python", "fastapi"], limit=10, exclude=set())
+    assert [job_id for job_id, _ in results] == ["backend", "data"]
+    assert results[0][1] > results[1][1] > 0
+
+    assert recommender.recommend(["python", "fastapi"], limit=1, exclude=set())[0][0] == "backend"
+    assert [job_id for job_id, _ in recommender.recommend(["python"], 10, {"backend"})] == ["data"]
+    assert recommender.recommend(["cobol"], 10, set()) == []
+    assert JobRecommender().recommend(["python"], 10, set()) == []
+
+
+def test_reloadable_index_is_abstract():
+    with pytest.raises(TypeError):
+        ReloadableIndex()
+
+
+def test_jobs_added_during_a_reload_survive_the_swap(db):
+    async def scenario():
+        await db.jobs.insert_one({"id": "old", "status": "active", "requirements": ["python"]})
+        recommender = JobRecommender()
+        build = recommender._build
+
+        async def slow_build():
+            fresh = await build()
+            recommender.add_job("new", ["python", "django"])
+            return fresh
+
+        recommender._build = slow_build
+        await recommender.reload()
+        assert [job_id for job_id, _ in recommender.recommend(["django"], 10, set())] == ["new"]
+        assert recommender.stats()["jobs"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_recommended_endpoint_skips_applied_jobs(db):
+    async def scenario():
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            seeker, _ = await register(api, "seeker@example.com")
+            await api.put("/users/me", json={"skills": ["Python", "FastAPI"]}, headers=seeker)
+            backend = await post_job(api, recruiter, title="Backend", requirements=["Python", "FastAPI"])
+            data = await post_job(api, recruiter, title="Data", requirements=["Python", "Pandas"])
+            await post_job(api, recruiter, title="Frontend", requirements=["React"])
+
+            ranked = (await api.get("/jobs/recommended", headers=seeker)).json()
+            assert [job["id"] for job in ranked] == [backend["id"], data["id"]]
+
+            await api.post(f"/jobs/{backend['id']}/apply", headers=seeker)
+            ranked = (await api.get("/jobs/recommended", headers=seeker)).json()
+            assert [job["id"] for job in ranked] == [data["id"]]
+
+    asyncio.run(scenario())
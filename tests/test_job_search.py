@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+import server
+from tests.helpers import api_client
+
+
+class FakeAggregation:
+    def __init__(self, result):
+        self.result = result
+
+    async def to_list(self, length):
+        return [self.result]
+
+
+def test_search_runs_one_faceted_pipeline(db, monkeypatch):
+    # mongomock has no $text support, so the pipeline is captured instead of executed
+    pipelines = []
+    job = {
+        "id": "j1", "title": "Python Engineer", "company": "Acme", "description": "APIs",
+        "requirements": ["python"], "location": "Berlin", "job_type": "Full-time", "remote_allowed": False,
+        "experience_level": "Senior", "posted_by": "r1",
+        "applications_count": 2, "score": 1.5
+    }
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        pipelines.append(pipeline)
+        return FakeAggregation({
+            "results": [job],
+            "total": [{"count": 7}],
+            "location": [{"_id": "Berlin", "count": 5}, {"_id": "Remote", "count": 2}],
+            "job_type": [{"_id": "Full-time", "count": 7}],
+            "remote_allowed": [{"_id": False, "count": 7}]
+        })
+
+    monkeypatch.setattr(type(db.jobs), "aggregate", aggregate)
+    server.counter_buffer.incr("jobs", "j1", "applications_count")
+
+    async def scenario():
+        async with api_client() as api:
+            return await api.get("/jobs/search", params={
+                "query": "python", "location": "berlin", "skip": 20, "limit": 10
+            })
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 7
+    assert [hit["id"] for hit in body["results"]] == ["j1"]
+    assert body["results"][0]["applications_count"] == 3
+    assert body["facets"]["location"] == [{"value": "Berlin", "count": 5}, {"value": "Remote", "count": 2}]
+
+    (pipeline,) = pipelines
+    assert pipeline[0]["$match"]["$text"] == {"$search": "python"}
+    assert pipeline[0]["$match"]["location"] == {"$regex": "berlin", "$options": "i"}
+    assert pipeline[2]["$facet"]["results"][1:] == [{"$skip": 20}, {"$limit": 10}]
+
+
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": 101}, {"skip": -1}])
+def test_search_rejects_out_of_range_paging(db, params):
+    async def scenario():
+        async with api_client() as api:
+            return await api.get("/jobs/search", params={"query": "python", **params})
+
+    assert asyncio.run(scenario()).status_code == 422
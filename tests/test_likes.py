@@ -0,0 +1,54 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, register
+
+
+def test_like_toggle_and_explicit_state(db):
+    async def scenario():
+        await server.create_indexes()
+        async with api_client() as api:
+            headers, _ = await register(api, "liker@example.com")
+            post = (await api.post("/posts", json={"content": "hello"}, headers=headers)).json()
+            like_url = f"/posts/{post['id']}/like"
+
+            async def like(**params):
+                response = await api.post(like_url, params=params, headers=headers)
+                assert response.status_code == 200
+                body = response.json()
+                return body["liked"], body["likes_count"]
+
+            assert await like() == (True, 1)
+            assert await like() == (False, 0)
+            assert await like(liked="true") == (True, 1)
+            assert await like(liked="true") == (True, 1)
+            assert await like(liked="false") == (False, 0)
+            assert await like(liked="false") == (False, 0)
+            assert await like() == (True, 1)
+
+            liked = await api.get("/posts/liked", params={"post_ids": [post["id"], "other"]}, headers=headers)
+            assert liked.json() == {"liked": [post["id"]]}
+            assert await db.post_likes.count_documents({"post_id": post["id"]}) == 1
+
+            await server.counter_buffer.flush()
+            assert (await db.posts.find_one({"id": post["id"]}))["likes_count"] == 1
+            assert (await api.post("/posts/missing/like", headers=headers)).status_code == 404
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_likes_count_once(db):
+    async def scenario():
+        await server.create_indexes()
+        async with api_client() as api:
+            headers, _ = await register(api, "liker@example.com")
+            post = (await api.post("/posts", json={"content": "hello"}, headers=headers)).json()
+            responses = await asyncio.gather(*[
+                api.post(f"/posts/{post['id']}/like", params={"liked": "true"}, headers=headers) for _ in range(5)
+            ])
+            assert {response.json()["liked"] for response in responses} == {True}
+            assert await db.post_likes.count_documents({"post_id": post["id"]}) == 1
+            await server.counter_buffer.flush()
+            assert (await db.posts.find_one({"id": post["id"]}))["likes_count"] == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,95 @@
+import asyncio
+import io
+
+import pytest
+from PIL import Image
+
+import server
+from server import parse_byte_range
+from tests.helpers import api_client, register
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999)),
+    ("bytes=900-5000", (900, 999)),
+    (" bytes=0-0 ", (0, 0)),
+])
+def test_parse_byte_range(header, expected):
+    assert parse_byte_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=-", "bytes=-0", "bytes=1000-", "bytes=5-2", "bytes=0-1,5-6", "items=0-1"])
+def test_parse_byte_range_unsatisfiable(header):
+    assert parse_byte_range(header, 1000) is None
+
+
+@pytest.fixture
+def media_store(monkeypatch, tmp_path):
+    store = server.MediaStore(tmp_path, server.MAX_UPLOAD_BYTES, 1)
+    monkeypatch.setattr(server, "media_store", store)
+    yield store
+    store.shutdown()
+
+
+def png(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_pool_workers_do_not_fork_the_server(media_store):
+    media_store.start()
+    assert media_store._pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_upload_renders_thumbnails_and_serves_ranges(db, media_store):
+    async def scenario():
+        async with api_client() as api:
+            headers, _ = await register(api, "photo@example.com")
+            upload = {"file": ("me.png", png(600, 300), "image/png")}
+            body = (await api.post("/users/me/profile-picture", files=upload, headers=headers)).json()
+            assert sorted(map(int, body["thumbnails"])) == sorted(server.THUMBNAIL_SIZES)
+            assert (await api.get("/users/me", headers=headers)).json()["profile_picture"] == body["profile_picture"]
+
+            thumbnail = await api.get(body["profile_picture"].removeprefix("/api"))
+            assert thumbnail.headers["content-type"] == "image/webp"
+            assert Image.open(io.BytesIO(thumbnail.content)).size == (256, 128)
+
+            original = body["original"].removeprefix("/api")
+            full = await api.get(original)
+            partial = await api.get(original, headers={"Range": "bytes=10-19"})
+            assert partial.status_code == 206 and partial.content == full.content[10:20]
+            assert partial.headers["content-range"] == f"bytes 10-19/{len(full.content)}"
+            unsatisfiable = await api.get(original, headers={"Range": "bytes=99999999-"})
+            assert unsatisfiable.status_code == 416
+            cached = await api.get(original, headers={"If-None-Match": full.headers["etag"]})
+            assert cached.status_code == 304
+            assert (await api.get("/media/../server.py")).status_code == 404
+
+    asyncio.run(scenario())
+
+
+def test_rejected_uploads_leave_no_files(db, media_store, monkeypatch):
+    monkeypatch.setattr(server, "MAX_IMAGE_PIXELS", 100)
+
+    async def scenario():
+        async with api_client() as api:
+            headers, _ = await register(api, "photo@example.com")
+
+            async def upload(content: bytes):
+                return await api.post(
+                    "/users/me/profile-picture", files={"file": ("x", content, "image/png")}, headers=headers
+                )
+
+            bomb = await upload(png(20, 20))
+            assert bomb.status_code == 400 and bomb.json()["detail"] == "Image exceeds 100 pixels"
+            truncated = await upload(png(5, 5)[:40])
+            assert truncated.status_code == 400 and truncated.json()["detail"] == "Image could not be decoded"
+            assert (await upload(b"GIF87a not really")).status_code == 400
+            assert (await upload(b"plain text")).status_code == 415
+            assert list(media_store.root.iterdir()) == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import server
+from server import LatencyHistogram, MongoCommandMetrics, MongoPoolMetrics
+from tests.helpers import api_client, register
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for seconds in (0.0005, 0.002, 0.002, 0.02, 20):
+        histogram.observe(seconds)
+    cumulative = dict(histogram.cumulative())
+    assert cumulative[0.001] == 1 and cumulative[0.0025] == 3 and cumulative[float("inf")] == 5
+    assert histogram.count == 5 and histogram.sum == pytest.approx(20.0245)
+    assert 0.001 <= histogram.quantile(0.5) <= 0.0025
+    assert histogram.quantile(0.99) == LatencyHistogram.BUCKETS[-1]
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_command_metrics_track_collection_and_failures():
+    metrics = MongoCommandMetrics()
+
+    def event(request_id, command_name, command, duration_micros=0):
+        return SimpleNamespace(
+            connection_id=("db", 27017), request_id=request_id, command_name=command_name,
+            command=command, duration_micros=duration_micros
+        )
+
+    metrics.started(event(1, "find", {"find": "users"}))
+    metrics.succeeded(event(1, "find", {}, 1500))
+    metrics.started(event(2, "getMore", {"getMore": 42, "collection": "users"}))
+    metrics.failed(event(2, "getMore", {}, 500))
+
+    assert metrics.latency[("users", "find")].count == 1
+    assert metrics.latency[("users", "getMore")].sum == pytest.approx(0.0005)
+    assert metrics.failures == {("users", "getMore"): 1}
+
+
+def test_pool_metrics_gauges():
+    metrics = MongoPoolMetrics()
+    event = SimpleNamespace(address=("db", 27017), reason="timeout")
+    metrics.connection_created(event)
+    metrics.connection_check_out_started(event)
+    metrics.connection_checked_out(event)
+    metrics.connection_check_out_started(event)
+    metrics.connection_check_out_failed(event)
+    stats = metrics.stats()
+    assert stats["open_connections"] == {"db:27017": 1}
+    assert stats["checked_out"] == {"db:27017": 1}
+    assert stats["checkout_failures"] == 1
+    assert metrics.checkout_wait["db:27017"].count == 2
+
+
+def test_metrics_endpoint_requires_admin_or_token(db, monkeypatch):
+    async def scenario():
+        async with api_client() as api:
+            admin, _ = await register(api, "admin@example.com", role="admin")
+            seeker, _ = await register(api, "seeker@example.com")
+            assert (await api.get("/metrics")).status_code == 401
+            assert (await api.get("/metrics", headers=seeker)).status_code == 403
+            response = await api.get("/metrics", headers=admin)
+            assert response.status_code == 200
+            assert "# TYPE linkdev_http_request_duration_seconds summary" in response.text
+
+            monkeypatch.setattr(server, "METRICS_TOKEN", "scrape-secret")
+            assert (await api.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})).status_code == 200
+            assert (await api.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 401
+
+    asyncio.run(scenario())
@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from server import decode_cursor, encode_cursor, keyset_filter, page_offset
+from tests.helpers import api_client, post_job, register
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 250000)
+    assert decode_cursor(encode_cursor(created_at, "abc")) == (created_at, "abc")
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24", "WzFd", "WyJub3QgYSBkYXRlIiwiYSJd"])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_keyset_filter_breaks_ties_on_id():
+    created_at = datetime(2024, 5, 1)
+    assert keyset_filter("created_at", encode_cursor(created_at, "m")) == {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": "m"}}
+        ]
+    }
+
+
+def test_page_offset_ignores_skip_with_a_cursor():
+    assert page_offset(40, None) == 40
+    assert page_offset(40, "cursor") == 0
+
+
+async def walk(api, path: str, headers: dict, limit: int) -> list:
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await api.get(path, params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        pages.append([item["id"] for item in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+
+
+def test_cursor_and_offset_pages_agree(db):
+    async def scenario():
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            for index in range(5):
+                await post_job(api, recruiter, title=f"Job {index}")
+                await register(api, f"user{index}@example.com")
+
+            for path in ("/jobs", "/users"):
+                pages = await walk(api, path, recruiter, 2)
+                flat = [item for page in pages for item in page]
+                assert len(flat) == len(set(flat))
+                offset_pages = [
+                    [item["id"] for item in (await api.get(
+                        path, params={"skip": skip, "limit": 2}, headers=recruiter
+                    )).json()]
+                    for skip in range(0, len(flat), 2)
+                ]
+                assert offset_pages == pages[:len(offset_pages)]
+
+            bad = await api.get("/jobs", params={"cursor": "garbage"})
+            assert bad.status_code == 400
+
+    asyncio.run(scenario())
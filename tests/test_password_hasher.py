@@ -0,0 +1,39 @@
+import asyncio
+import threading
+
+import server
+from tests.helpers import api_client, register
+
+
+def test_hashing_runs_off_the_event_loop(monkeypatch):
+    hasher = server.PasswordHasher(2, 8)
+    threads = []
+
+    def fake_hash(password):
+        threads.append(threading.current_thread().name)
+        return "hashed"
+
+    monkeypatch.setattr(server.pwd_context, "hash", fake_hash)
+
+    async def scenario():
+        assert await hasher.hash("secret123") == "hashed"
+
+    asyncio.run(scenario())
+    hasher.shutdown()
+    assert threads[0].startswith("password-hash")
+    assert hasher.stats()["completed"] == 1
+
+
+def test_login_is_rejected_once_the_queue_is_full(db, monkeypatch):
+    async def scenario():
+        async with api_client() as api:
+            await register(api, "busy@example.com")
+            hasher = server.PasswordHasher(1, 0)
+            monkeypatch.setattr(server, "password_hasher", hasher)
+            response = await api.post("/auth/login", json={"email": "busy@example.com", "password": "secret123"})
+            assert response.status_code == 503
+            assert response.headers["retry-after"] == "1"
+            assert hasher.stats()["rejected"] == 1
+            hasher.shutdown()
+
+    asyncio.run(scenario())
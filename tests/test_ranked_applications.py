@@ -0,0 +1,62 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from server import experience_fit, rank_applicants
+from tests.helpers import api_client, post_job, register
+
+
+def test_experience_fit():
+    years = np.array([0, 2, 5, 10, 20, np.nan])
+    assert experience_fit("Senior Engineer", years) == pytest.approx([0, 0, 1, 1, 0.7, 0.5])
+    # Open-ended levels never penalise surplus experience
+    assert experience_fit("lead", np.array([8, 30])) == pytest.approx([1, 1])
+    assert experience_fit("", np.array([3, np.nan])) == pytest.approx([1, 1])
+
+
+def test_rank_applicants():
+    job = {"requirements": ["Python", "FastAPI", "MongoDB", "Docker"], "experience_level": "mid"}
+    applicants = [
+        {"skills": ["python", "fastapi", "mongodb"], "experience_years": 3},
+        {"skills": ["Java"], "experience_years": 3},
+        {"skills": ["python"]},
+        {"skills": ["python", "docker"], "experience_years": 0}
+    ]
+    scores, skill_match, fit = rank_applicants(job, applicants)
+    assert skill_match == pytest.approx([0.75, 0, 0.25, 0.5])
+    assert fit == pytest.approx([1, 1, 0.5, 1 / 3])
+    assert scores == pytest.approx(0.75 * skill_match + 0.25 * fit)
+    assert list(np.argsort(-scores, kind="stable")) == [0, 3, 2, 1]
+
+
+def test_rank_applicants_without_requirements():
+    scores, skill_match, _ = rank_applicants({"experience_level": "entry"}, [{"skills": ["go"], "experience_years": 1}])
+    assert skill_match == pytest.approx([0])
+    assert scores == pytest.approx([0.25])
+
+
+def test_ranked_applications_endpoint(db):
+    async def scenario():
+        async with api_client() as api:
+            recruiter, _ = await register(api, "recruiter@example.com", role="recruiter")
+            job = await post_job(api, recruiter, requirements=["Python", "MongoDB"], experience_level="Mid-level")
+            for name, skills, years in [("Weak", ["Java"], 3), ("Strong", ["Python", "MongoDB"], 4), ("Half", ["Python"], 1)]:
+                seeker, _ = await register(api, f"{name.lower()}@example.com", first_name=name)
+                await api.put("/users/me", json={"skills": skills, "experience_years": years}, headers=seeker)
+                await api.post(f"/jobs/{job['id']}/apply", headers=seeker)
+
+            url = f"/jobs/{job['id']}/applications/ranked"
+            body = (await api.get(url, headers=recruiter)).json()
+            assert body["total"] == 3
+            assert [item["applicant"]["first_name"] for item in body["results"]] == ["Strong", "Half", "Weak"]
+            assert body["results"][0]["skill_match"] == pytest.approx(1.0)
+            assert body["results"][1]["experience_fit"] == pytest.approx(2 / 3)
+
+            page = (await api.get(url, params={"skip": 1, "limit": 1}, headers=recruiter)).json()
+            assert [item["applicant"]["first_name"] for item in page["results"]] == ["Half"]
+            assert (await api.get(url, params={"limit": 0}, headers=recruiter)).status_code == 422
+            outsider, _ = await register(api, "outsider@example.com", role="recruiter")
+            assert (await api.get(url, headers=outsider)).status_code == 403
+
+    asyncio.run(scenario())
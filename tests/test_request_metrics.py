@@ -0,0 +1,58 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, register
+
+
+def test_requests_are_labelled_by_route_template(db, monkeypatch):
+    monkeypatch.setattr(server, "request_metrics", server.RequestMetrics())
+
+    async def scenario():
+        async with api_client() as api:
+            headers, _ = await register(api, "viewer@example.com")
+            for user_id in ("a", "b", "c"):
+                await api.get(f"/users/{user_id}", headers=headers)
+            await api.get("/no/such/route")
+
+    asyncio.run(scenario())
+    metrics = server.request_metrics
+    assert metrics.latency[("GET", "/api/users/{user_id}")].count == 3
+    assert metrics.responses[("GET", "/api/users/{user_id}", 404)] == 3
+    assert metrics.responses[("POST", "/api/auth/register", 200)] == 1
+    assert ("GET", "unmatched", 404) in metrics.responses
+    rendered = "\n".join(server.render_request_metrics())
+    assert 'linkdev_http_responses_total{method="GET",route="/api/users/{user_id}",status="404"} 3' in rendered
+
+
+def test_db_calls_header_is_opt_in(db, monkeypatch):
+    async def scenario():
+        async with api_client() as api:
+            return (await api.get("/")).headers
+
+    assert "x-db-calls" not in asyncio.run(scenario())
+    monkeypatch.setattr(server, "EXPOSE_DB_CALLS_HEADER", True)
+    assert asyncio.run(scenario())["x-db-calls"] == "0"
+
+
+def test_slow_requests_are_profiled_on_demand(db, monkeypatch):
+    monkeypatch.setattr(
+        server, "slow_request_profiler", server.SlowRequestProfiler(False, server.SLOW_REQUEST_THRESHOLD_MS, 5)
+    )
+
+    async def scenario():
+        async with api_client() as api:
+            admin, _ = await register(api, "admin@example.com", role="admin")
+            seeker, _ = await register(api, "seeker@example.com")
+            assert (await api.put("/admin/profiles", params={"enabled": "true"}, headers=seeker)).status_code == 403
+            response = await api.put("/admin/profiles", params={"enabled": "true", "threshold_ms": 0}, headers=admin)
+            assert response.json() == {"enabled": True, "threshold_ms": 0}
+
+            await api.get("/users/me", headers=seeker)
+            profiles = (await api.get("/admin/profiles", headers=admin)).json()["profiles"]
+            captured = next(profile for profile in profiles if profile["route"] == "/api/users/me")
+            assert "stats" not in captured
+            stats = await api.get(f"/admin/profiles/{captured['id']}", headers=admin)
+            assert "function calls" in stats.text
+            assert (await api.get("/admin/profiles/missing", headers=admin)).status_code == 404
+
+    asyncio.run(scenario())
@@ -0,0 +1,34 @@
+import asyncio
+
+from server import build_search_tokens
+from tests.helpers import api_client, connect, register
+
+
+def test_search_tokens_split_names_and_skills():
+    assert build_search_tokens("Mary-Jane", "O Neil", ["Node.js", "Machine Learning"]) == [
+        "jane", "learning", "machine", "machine learning", "mary", "mary-jane", "neil", "node.js", "o", "o neil"
+    ]
+
+
+def test_typeahead_ranks_connections_first(db):
+    async def scenario():
+        async with api_client() as api:
+            viewer, _ = await register(api, "viewer@example.com", first_name="Sam", last_name="Viewer")
+            stranger, _ = await register(api, "stranger@example.com", first_name="Sam", last_name="Adams")
+            friend, friend_id = await register(api, "friend@example.com", first_name="Samantha", last_name="Jones")
+            await register(api, "other@example.com", first_name="Alex", last_name="Other")
+            await connect(api, viewer, friend, friend_id)
+
+            hits = (await api.get("/users/typeahead", params={"q": "sam"}, headers=viewer)).json()
+            assert [(hit["first_name"], hit["in_network"]) for hit in hits] == [("Samantha", True), ("Sam", False)]
+
+            hits = (await api.get("/users/typeahead", params={"q": "SAM ada"}, headers=viewer)).json()
+            assert [hit["last_name"] for hit in hits] == ["Adams"]
+            assert (await api.get("/users/typeahead", params={"q": "  "}, headers=viewer)).json() == []
+
+            limited = await api.get("/users/typeahead", params={"q": "sam", "limit": 1}, headers=viewer)
+            assert [hit["first_name"] for hit in limited.json()] == ["Samantha"]
+            too_many = await api.get("/users/typeahead", params={"q": "sam", "limit": 1000}, headers=viewer)
+            assert too_many.status_code == 422
+
+    asyncio.run(scenario())
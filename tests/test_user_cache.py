@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import server
+from tests.helpers import api_client, register
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries(monkeypatch):
+    cache = server.TTLCache(2, 60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    now = time.monotonic()
+    monkeypatch.setattr(server.time, "monotonic", lambda: now + 61)
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 2, 1)
+
+
+def test_authenticated_requests_reuse_the_cached_user(db, monkeypatch):
+    async def scenario():
+        async with api_client() as api:
+            headers, user_id = await register(api, "cached@example.com", first_name="Before")
+            lookups = []
+            collection_type = type(db.users)
+            find_one = collection_type.find_one
+
+            async def counting_find_one(self, filter=None, *args, **kwargs):
+                if self.name == "users" and filter == {"id": user_id}:
+                    lookups.append(filter)
+                return await find_one(self, filter, *args, **kwargs)
+
+            monkeypatch.setattr(collection_type, "find_one", counting_find_one)
+            for _ in range(3):
+                assert (await api.get("/users/me", headers=headers)).json()["first_name"] == "Before"
+            assert len(lookups) == 1
+
+            # The writer invalidates its own entry, so the next request sees the update
+            await api.put("/users/me", json={"first_name": "After"}, headers=headers)
+            assert (await api.get("/users/me", headers=headers)).json()["first_name"] == "After"
+            assert server.user_cache.stats()["hits"] >= 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,31 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, connect, register
+
+PRIVATE_FIELDS = {"password", "search_tokens", "_id"}
+
+
+def test_list_views_return_cards_without_private_or_bulky_fields(db):
+    async def scenario():
+        async with api_client() as api:
+            viewer, _ = await register(api, "viewer@example.com")
+            other, other_id = await register(api, "other@example.com", first_name="Grace")
+            await api.put("/users/me", json={"experience": [{"title": "Admiral"}]}, headers=other)
+            await connect(api, viewer, other, other_id)
+
+            card_fields = set(server.UserCard.model_fields)
+            connections = (await api.get("/connections", headers=viewer)).json()
+            assert [set(card) for card in connections] == [card_fields]
+            results = (await api.get("/users", params={"query": "Grace"}, headers=viewer)).json()
+            assert [user["id"] for user in results] == [other_id]
+            assert set(results[0]) == card_fields
+
+            profile = (await api.get(f"/users/{other_id}", headers=viewer)).json()
+            assert profile["experience"] == [{"title": "Admiral"}]
+            assert not PRIVATE_FIELDS & set(profile)
+            updated = (await api.put("/users/me", json={"headline": "Engineer"}, headers=viewer)).json()
+            assert updated["headline"] == "Engineer"
+            assert not PRIVATE_FIELDS & set(updated)
+
+    asyncio.run(scenario())
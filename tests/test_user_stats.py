@@ -0,0 +1,62 @@
+import asyncio
+
+import server
+from tests.helpers import api_client, connect, post_job, register
+
+
+def test_dashboard_stats_follow_activity(db):
+    async def scenario():
+        async with api_client() as api:
+            recruiter, recruiter_id = await register(api, "recruiter@example.com", role="recruiter")
+            seeker, seeker_id = await register(api, "seeker@example.com")
+            # The first read builds the documents; later activity only increments them
+            assert (await api.get("/dashboard/stats", headers=recruiter)).json()["jobs_posted"] == 0
+            assert (await api.get("/dashboard/stats", headers=seeker)).json()["applications_sent"] == 0
+
+            job = await post_job(api, recruiter)
+            await api.post(f"/jobs/{job['id']}/apply", headers=seeker)
+            await connect(api, recruiter, seeker, seeker_id)
+            await api.post("/posts", json={"content": "hiring"}, headers=recruiter)
+
+            assert (await api.get("/dashboard/stats", headers=recruiter)).json() == {
+                "connections": 1, "posts": 1, "jobs_posted": 1, "applications_received": 1
+            }
+            assert (await api.get("/dashboard/stats", headers=seeker)).json() == {
+                "connections": 1, "posts": 0, "applications_sent": 1
+            }
+            assert (await db.user_stats.find_one({"user_id": recruiter_id}))["jobs_posted"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_increments_skip_users_without_a_stats_document(db):
+    async def scenario():
+        await server.increment_user_stats("ghost", posts=1)
+        assert await db.user_stats.count_documents({}) == 0
+
+    asyncio.run(scenario())
+
+
+def test_reconcile_repairs_drift(db):
+    async def scenario():
+        async with api_client() as api:
+            admin, _ = await register(api, "admin@example.com", role="admin")
+            recruiter, recruiter_id = await register(api, "recruiter@example.com", role="recruiter")
+            seeker, seeker_id = await register(api, "seeker@example.com")
+            job = await post_job(api, recruiter)
+            await api.post(f"/jobs/{job['id']}/apply", headers=seeker)
+            await connect(api, recruiter, seeker, seeker_id)
+
+            await db.user_stats.update_one({"user_id": recruiter_id}, {"$set": {"jobs_posted": 40}}, upsert=True)
+            assert (await api.post("/admin/stats/reconcile", headers=recruiter)).status_code == 403
+            response = await api.post("/admin/stats/reconcile", headers=admin)
+            assert response.json() == {"message": "User stats reconciled", "users": 3}
+
+            stats = await db.user_stats.find_one({"user_id": recruiter_id}, {"_id": 0, "updated_at": 0, "reconciled_at": 0})
+            assert stats == {
+                "user_id": recruiter_id, "connections": 1, "posts": 0, "jobs_posted": 1,
+                "applications_received": 1, "applications_sent": 0
+            }
+            assert (await db.user_stats.find_one({"user_id": seeker_id}))["applications_sent"] == 1
+
+    asyncio.run(scenario())